@@ -0,0 +1,61 @@
+import py, pytest, os, sys
+
+
+import cppyy
+
+N = 10000
+
+cppyy.cppdef("""\
+namespace bench_pythonization {
+    class Point {
+    public:
+        double get_x() const { return fX; }
+        void set_x(double x) { fX = x; }
+        double x_ = 1.;
+        double fX = 1.;
+    };
+}""")
+
+ns = cppyy.gbl.bench_pythonization
+
+cppyy.py.add_pythonization(
+    cppyy.py.make_property('Point$', 'get_(x)$', 'set_(x)$'), 'bench_pythonization')
+
+# the accessors as make_property created them before: Python-side indirection
+ns.Point.x_proxy = property(lambda obj: obj.get_x(), lambda obj, v: obj.set_x(v))
+
+
+#- group: property-get -------------------------------------------------------
+def read_attribute(inst, name):
+    for i in range(N):
+        getattr(inst, name)
+
+@pytest.mark.benchmark(group='property-get', warmup=True)
+def test_data_member_get(benchmark):
+    benchmark(read_attribute, ns.Point(), 'x_')
+
+@pytest.mark.benchmark(group='property-get', warmup=True)
+def test_make_property_get(benchmark):
+    benchmark(read_attribute, ns.Point(), 'x')
+
+@pytest.mark.benchmark(group='property-get', warmup=True)
+def test_python_property_get(benchmark):
+    benchmark(read_attribute, ns.Point(), 'x_proxy')
+
+
+#- group: property-set -------------------------------------------------------
+def write_attribute(inst, name):
+    for i in range(N):
+        setattr(inst, name, 2.)
+
+@pytest.mark.benchmark(group='property-set', warmup=True)
+def test_data_member_set(benchmark):
+    benchmark(write_attribute, ns.Point(), 'x_')
+
+@pytest.mark.benchmark(group='property-set', warmup=True)
+def test_make_property_set(benchmark):
+    benchmark(write_attribute, ns.Point(), 'x')
+
+@pytest.mark.benchmark(group='property-set', warmup=True)
+def test_python_property_set(benchmark):
+    benchmark(write_attribute, ns.Point(), 'x_proxy')
@@ -35,6 +35,12 @@ except ImportError:
         warnings.warn('swig tests disabled')
         swig = False
 
+try:
+    import numpy as np
+except ImportError:
+    warnings.warn('numpy tests disabled')
+    np = None
+
 all_benches = []
 
 
@@ -47,8 +53,82 @@ def test_{0}_stl_vector(benchmark):
 )))
 
 
+#- group: stl-vector-export (cppyy only) -------------------------------------
+@pytest.mark.benchmark(group='stl-vector-export', warmup=True)
+def test_cppyy_stl_vector_iterate(benchmark):
+    benchmark(list, cppyy.gbl.global_vector)
+
+@pytest.mark.benchmark(group='stl-vector-export', warmup=True)
+def test_cppyy_stl_vector_tolist(benchmark):
+    benchmark(cppyy.gbl.global_vector.tolist)
+
+@pytest.mark.benchmark(group='stl-vector-export', warmup=True)
+def test_cppyy_stl_vector_tobytes(benchmark):
+    benchmark(cppyy.gbl.global_vector.tobytes)
+
+@pytest.mark.benchmark(group='stl-vector-export', warmup=True)
+def test_cppyy_stl_vector_sum_tolist(benchmark):
+    benchmark(lambda: sum(cppyy.gbl.global_vector.tolist()))
+
+@pytest.mark.skipif(np is None, reason='numpy is not installed')
+@pytest.mark.benchmark(group='stl-vector-export', warmup=True)
+def test_cppyy_stl_vector_to_numpy(benchmark):
+    benchmark(cppyy.gbl.global_vector.to_numpy)
+
+
 #- actual creation of all benches --------------------------------------------
 for group, benches in all_benches:
     for bench in benches:
         for label, modname in all_configs:
             exec(preamble+bench.format(label, modname))
+
+
+#- group: stl-vector-construct (cppyy only) ----------------------------------
+NELEMENTS = 1000000
+
+vector_double = cppyy.gbl.std.vector['double']
+list_of_floats = [float(i) for i in range(NELEMENTS)]
+
+@pytest.mark.benchmark(group='stl-vector-construct', warmup=True)
+def test_cppyy_vector_constructor(benchmark):
+    benchmark(vector_double, list_of_floats)
+
+@pytest.mark.benchmark(group='stl-vector-construct', warmup=True)
+def test_cppyy_vector_cpp17_deduction(benchmark):
+    benchmark(cppyy.gbl.std.vector, list_of_floats)
+
+@pytest.mark.benchmark(group='stl-vector-construct', warmup=True)
+def test_cppyy_vector_from_iterable(benchmark):
+    benchmark(vector_double.from_iterable, list_of_floats)
+
+@pytest.mark.benchmark(group='stl-vector-construct', warmup=True)
+def test_cppyy_vector_from_buffer(benchmark):
+    import array
+    benchmark(vector_double.from_buffer, array.array('d', list_of_floats))
+
+@pytest.mark.skipif(np is None, reason='numpy is not installed')
+@pytest.mark.benchmark(group='stl-vector-construct', warmup=True)
+def test_cppyy_vector_from_numpy(benchmark):
+    benchmark(vector_double.from_buffer, np.array(list_of_floats))
+
+
+#- group: stl-map-convert (cppyy only) ---------------------------------------
+map_str_double = cppyy.gbl.std.map['std::string', 'double']
+dict_of_floats = dict((str(i), float(i)) for i in range(NELEMENTS))
+global_map = map_str_double.from_dict(dict_of_floats)
+
+@pytest.mark.benchmark(group='stl-map-convert', warmup=True)
+def test_cppyy_map_iterate(benchmark):
+    benchmark(lambda: dict((k, v) for k, v in global_map))
+
+@pytest.mark.benchmark(group='stl-map-convert', warmup=True)
+def test_cppyy_map_to_dict(benchmark):
+    benchmark(global_map.to_dict)
+
+@pytest.mark.benchmark(group='stl-map-convert', warmup=True)
+def test_cppyy_map_constructor(benchmark):
+    benchmark(map_str_double, dict_of_floats)
+
+@pytest.mark.benchmark(group='stl-map-convert', warmup=True)
+def test_cppyy_map_from_dict(benchmark):
+    benchmark(map_str_double.from_dict, dict_of_floats)
@@ -0,0 +1,45 @@
+import py, pytest, os, sys, itertools
+
+
+import cppyy
+
+NFRAGMENTS = 100
+
+_unique = itertools.count()
+def make_fragments():
+  # every round needs fresh names, as C++ code can only be declared once
+    n = next(_unique)
+    return ((["namespace bench_startup_%d { int f%d() { return %d; } }" % (n, i, i)\
+              for i in range(NFRAGMENTS)],), {})
+
+
+#- group: cppdef -------------------------------------------------------------
+@pytest.mark.benchmark(group='cppdef', warmup=False)
+def test_cppdef_loop(benchmark):
+    def declare(fragments):
+        for src in fragments:
+            cppyy.cppdef(src)
+    benchmark.pedantic(declare, setup=make_fragments, rounds=20)
+
+@pytest.mark.benchmark(group='cppdef', warmup=False)
+def test_cppdef_many(benchmark):
+    benchmark.pedantic(cppyy.cppdef_many, setup=make_fragments, rounds=20)
+
+
+#- group: template -----------------------------------------------------------
+def make_types():
+    n = next(_unique)
+    names = ["bench_startup_%d::T%d" % (n, i) for i in range(NFRAGMENTS)]
+    cppyy.cppdef("namespace bench_startup_%d { %s }" %\
+        (n, ' '.join(["struct T%d {};" % i for i in range(NFRAGMENTS)])))
+    return ((names,), {})
+
+@pytest.mark.benchmark(group='template', warmup=False)
+def test_template_loop(benchmark):
+    def instantiate(names):
+        return [cppyy.gbl.std.vector[name] for name in names]
+    benchmark.pedantic(instantiate, setup=make_types, rounds=20)
+
+@pytest.mark.benchmark(group='template', warmup=False)
+def test_template_instantiate_many(benchmark):
+    benchmark.pedantic(cppyy.gbl.std.vector.instantiate_many, setup=make_types, rounds=20)
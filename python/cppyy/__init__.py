@@ -35,24 +35,35 @@ __author__ = 'Wim Lavrijsen <WLavrijsen@lbl.gov>'
 
 __all__ = [
     'cppdef',                 # declare C++ source to Cling
+    'cppdef_many',            # declare many C++ sources in one transaction
+    'cppdef_lazy',            # declare C++ source on first use of its names
     'cppexec',                # execute a C++ statement
     'macro',                  # attempt to evaluate a cpp macro
     'include',                # load and jit a header file
+    'include_async',          # load and jit a header file in the background
     'c_include',              # load and jit a C header file
     'load_library',           # load a shared library
     'nullptr',                # unique pointer representing NULL
     'sizeof',                 # size of a C++ type
+    'sizeof_many',            # sizes of many C++ types
     'typeid',                 # typeid of a C++ type
     'multi',                  # helper for multiple inheritance
+    'warm',                   # resolve proxies up-front, e.g. before fork
+    'shared_pages',           # memory pages shared with other processes
     'add_include_path',       # add a path to search for headers
     'add_library_path',       # add a path to search for headers
     'add_autoload_map',       # explicitly include an autoload map
     'set_debug',              # enable/disable debug output
+    'set_jit_cache',          # enable/disable on-disk caching of JIT results
+    'jit_cache_stats',        # hits/misses/size of the JIT results cache
+    'set_template_cache',     # record/replay template instantiations
+    'template_cache_stats',   # replay results of the template cache
     ]
 
 from ._version import __version__
+from . import _startup
 
-import ctypes, os, sys, sysconfig, warnings
+import ctypes, os, re, sys, sysconfig, warnings, weakref
 
 if not 'CLING_STANDARD_PCH' in os.environ:
     def _set_pch():
@@ -64,7 +75,9 @@ if not 'CLING_STANDARD_PCH' in os.environ:
                 os.environ['CLING_STANDARD_PCH'] = local_pch
         except (ImportError, AttributeError):
             pass
+    _startup.begin('pch')
     _set_pch(); del _set_pch
+    _startup.end()
 
 try:
     import __pypy__
@@ -75,10 +88,12 @@ except ImportError:
 
 # import separately instead of in the above try/except block for easier to
 # understand tracebacks
+_startup.begin('backend')
 if ispypy:
     from ._pypy_cppyy import *
 else:
     from ._cpython_cppyy import *
+_startup.end()
 
 
 #- allow importing from gbl --------------------------------------------------
@@ -87,11 +102,14 @@ sys.modules['cppyy.gbl.std'] = gbl.std
 
 
 #- enable auto-loading -------------------------------------------------------
+_startup.begin('autoloading')
 try:    gbl.gInterpreter.EnableAutoLoading()
 except: pass
+_startup.end()
 
 
 #- external typemap ----------------------------------------------------------
+_startup.begin('typemap')
 from . import _typemap
 _typemap.initialize(_backend)               # also creates (u)int8_t mapper
 
@@ -100,31 +118,24 @@ try:
     gbl.std.uint8_t = gbl.uint8_t
 except (AttributeError, TypeError):
     pass
+_startup.end()
 
 
 #- pythonization factories ---------------------------------------------------
+_startup.begin('pythonizations')
 from . import _pythonization as py
 py._set_backend(_backend)
 
 def _standard_pythonizations(pyclass, name):
-  # pythonization of tuple; TODO: placed here for convenience, but a custom case
-  # for tuples on each platform can be made much more performant ...
+  # pythonization of tuple; the accessors per index are resolved once, here
     if name.find('tuple<', 0, 6) == 0:
         import cppyy
+        from ._cpython_cppyy import _add_tuple_accessors
         pyclass._tuple_len = cppyy.gbl.std.tuple_size(pyclass).value
         def tuple_len(self):
             return self.__class__._tuple_len
         pyclass.__len__ = tuple_len
-        def tuple_getitem(self, idx, get=cppyy.gbl.std.get):
-            if idx < self.__class__._tuple_len:
-                res = get[idx](self)
-                try:
-                    res.__life_line = self
-                except Exception:
-                    pass
-                return res
-            raise IndexError(idx)
-        pyclass.__getitem__ = tuple_getitem
+        _add_tuple_accessors(pyclass, pyclass._tuple_len)
 
   # pythoniztion of std::string; placed here because it's simpler to write the
   # custom "npos" object (to allow easy result checking of find/rfind) in Python
@@ -137,6 +148,30 @@ def _standard_pythonizations(pyclass, name):
         del pyclass.__class__.npos          # drop b/c is const data
         pyclass.npos = NPOS(pyclass.npos)
 
+      # zero-copy and non-decoding access to the data, e.g. for binary payloads
+        from ._cpython_cppyy import _string_memoryview, _string_tobytes
+        pyclass.as_memoryview = _string_memoryview
+        pyclass.tobytes       = _string_tobytes
+
+  # bulk export (tolist, tobytes, to_numpy) of sequences of arithmetic types
+    elif name[:name.find('<')] in ('vector', 'array', 'deque', 'list', 'set'):
+        from ._cpython_cppyy import _add_bulk_export
+        _add_bulk_export(pyclass)
+
+  # zero-copy construction of views from (Python) buffers
+    elif name.find('span<', 0, 5) == 0:
+        from ._cpython_cppyy import _add_buffer_init
+        _add_buffer_init(pyclass, False)
+    elif name == 'string_view' or name.find('basic_string_view<char,', 0, 23) == 0 or \
+            name == 'basic_string_view<char>':
+        from ._cpython_cppyy import _add_buffer_init
+        _add_buffer_init(pyclass, True)
+
+  # bulk conversion (to_dict, from_dict, and keys/values/items as arrays) of maps
+    elif name[:name.find('<')] in ('map', 'unordered_map'):
+        from ._cpython_cppyy import _add_map_bulk_conversion
+        _add_map_bulk_conversion(pyclass)
+
     return True
 
 if not ispypy:
@@ -178,9 +213,12 @@ class make_smartptr(object):
 gbl.std.make_shared = make_smartptr(gbl.std.shared_ptr, gbl.std.make_shared)
 gbl.std.make_unique = make_smartptr(gbl.std.unique_ptr, gbl.std.make_unique)
 del make_smartptr
+_startup.end()
 
 
 #--- interface to Cling ------------------------------------------------------
+from . import _jitcache, _templcache
+
 class _stderr_capture(object):
     def __init__(self):
        self._capture = not gbl.CppyyLegacy.gDebug and True or False
@@ -197,6 +235,9 @@ class _stderr_capture(object):
 
 def cppdef(src):
     """Declare C++ source <src> to Cling."""
+    _wait_for_includes()
+    if _jitcache.load('cppdef', src):
+        return True
     with _stderr_capture() as err:
         errcode = gbl.gInterpreter.Declare(src)
     if not errcode or err.err:
@@ -204,6 +245,77 @@ def cppdef(src):
             warnings.warn(err.err, SyntaxWarning)
             return True
         raise SyntaxError('Failed to parse the given C++ code%s' % err.err)
+    _jitcache.store('cppdef', src)
+    return True
+
+_fragment_tag = re.compile(r'cppdef_many:(\d+)(?::\d+)*: (?:fatal )?error\b')
+def cppdef_many(sources):
+    """Declare all C++ sources in <sources> to Cling in a single transaction."""
+  # mark each fragment with a #line directive, so that any errors can be traced
+  # back to the fragment(s) responsible (notes, e.g. on a previous definition,
+  # may point to other fragments, so only the error lines count)
+    src = '\n'.join(['#line 1 "cppdef_many:%d"\n%s' % (i, s) for i, s in enumerate(sources)])
+    try:
+        return cppdef(src)
+    except SyntaxError as e:
+        failed = sorted(set(int(i) for i in _fragment_tag.findall(str(e))))
+        if not failed:
+            raise
+        err = str(e)[len('Failed to parse the given C++ code'):]
+        raise SyntaxError('Failed to parse the given C++ code fragment(s) %s%s' %\
+                          (', '.join(map(str, failed)), err))
+
+class _lazy_declaration(object):
+    __slots__ = ['src', 'pending']
+    def __init__(self, src):
+        self.src     = src
+        self.pending = []
+
+    def __call__(self):
+      # declare only once, no matter which of the provided names comes first
+        for lazy, name in self.pending:
+            lazy.pop(name, None)
+        del self.pending[:]
+        return cppdef(self.src)
+
+def _lazy_getattr(scope, name):
+    try:
+        declare = type(scope).__cppyy_lazy__[name]
+    except KeyError:
+      # the name may yet be provided by a header that is still being parsed; if
+      # not, repeat the lookup of the backend, to raise its (detailed) error
+        if not _wait_for_includes():
+            return type(scope).__getattribute__(scope, name)
+        return getattr(scope, name)
+    declare()
+    return getattr(scope, name)
+
+def _lazy_names(scope):
+    meta = type(scope)
+    if not '__cppyy_lazy__' in meta.__dict__:
+        meta.__cppyy_lazy__ = dict()
+        meta.__getattr__    = _lazy_getattr
+    return meta.__cppyy_lazy__
+
+def cppdef_lazy(src, provides):
+    """Declare C++ source <src> to Cling on first lookup of any of the (fully
+    qualified) names in <provides>."""
+    declare = _lazy_declaration(src)
+    for name in provides:
+      # find the innermost existing scope; the first unknown part is the name
+      # whose lookup triggers the declaration
+        scope, parts = gbl, name.split('::')
+        for part in parts[:-1]:
+            try:
+                scope = getattr(scope, part)
+            except AttributeError:
+                break
+        else:
+            part = parts[-1]
+
+        lazy = _lazy_names(scope)
+        lazy[part] = declare
+        declare.pending.append((lazy, part))
     return True
 
 def cppexec(stmt):
@@ -255,22 +367,106 @@ def load_library(name):
         raise RuntimeError('Unable to load library "%s"%s' % (name, err.err))
     return True
 
-def include(header):
-    """Load (and JIT) header file <header> into Cling."""
-    with _stderr_capture() as err:
-        errcode = gbl.gInterpreter.Declare('#include "%s"' % header)
+def _include(header, declare=None):
+    src = '#include "%s"' % header
+    if _jitcache.load('include', src):
+        return True
+    if declare is None:
+        with _stderr_capture() as err:
+            errcode = gbl.gInterpreter.Declare(src)
+        err = err.err
+    else:
+      # stderr is process-wide, so it can not be captured from the interpreter
+      # thread without swallowing output from the main thread as well
+        errcode, err = declare(src), ''
     if not errcode:
-        raise ImportError('Failed to load header file "%s"%s' % (header, err.err))
+        raise ImportError('Failed to load header file "%s"%s' % (header, err))
+    _jitcache.store('include', src)
     return True
 
+def include(header):
+    """Load (and JIT) header file <header> into Cling."""
+    _wait_for_includes()
+    return _include(header)
+
+_interpreter_thread = None
+_async_declare      = None
+_pending_includes   = []
+def _start_interpreter_thread():
+    global _interpreter_thread, _async_declare
+  # Cling is not re-entrant: have it serialize access from multiple threads; if
+  # that is not possible, headers are loaded synchronously instead
+    try:
+        gbl.CppyyLegacy.EnableThreadSafety()
+    except AttributeError:
+        _interpreter_thread = False
+        return
+
+  # only this entry point releases the GIL, not every use of Declare
+    gbl.gInterpreter.Declare("""namespace __cppyy_internal {
+        bool declare_async(CppyyLegacy::TInterpreter* interp, const char* code) {
+            return interp->Declare(code);
+        }
+    }""")
+    declare = getattr(gbl, '__cppyy_internal').declare_async
+    declare.__release_gil__ = True
+    _async_declare = lambda src: declare(gbl.gInterpreter, src)
+
+    import concurrent.futures
+    _interpreter_thread = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+def _wait_in_namespaces(scope, seen):
+  # have failed lookups in <scope> and the namespaces already bound below it
+  # wait for pending headers, which may provide the name
+    seen.add(id(scope))
+    _lazy_names(scope)
+    for value in list(vars(scope).values()):
+        if isinstance(value, getattr(_backend, 'CPPScope', ())) and \
+                not issubclass(value, _backend.CPPInstance) and not id(value) in seen:
+            _wait_in_namespaces(value, seen)
+
+def include_async(header):
+    """Load (and JIT) header file <header> into Cling on a background thread.
+    Returns a future; failed lookups in gbl and its namespaces wait for pending
+    headers before raising AttributeError."""
+    if _interpreter_thread is None:
+        _start_interpreter_thread()
+
+    if not _interpreter_thread:
+        import concurrent.futures
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(include(header))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    _wait_in_namespaces(gbl, set())
+    future = _interpreter_thread.submit(_include, header, _async_declare)
+    _pending_includes.append(future)
+    return future
+
+def _wait_for_includes():
+    waited = False
+    while _pending_includes:
+        future = _pending_includes.pop(0)
+        future.exception()          # errors are reported through the future
+        waited = True
+    return waited
+
 def c_include(header):
     """Load (and JIT) header file <header> into Cling."""
+    _wait_for_includes()
+    src = '#include "%s"' % header
+    if _jitcache.load('c_include', src):
+        return True
     with _stderr_capture() as err:
         errcode = gbl.gInterpreter.Declare("""extern "C" {
-#include "%s"
-}""" % header)
+%s
+}""" % src)
     if not errcode:
         raise ImportError('Failed to load header file "%s"%s' % (header, err.err))
+    _jitcache.store('c_include', src)
     return True
 
 def add_include_path(path):
@@ -286,6 +482,7 @@ def add_library_path(path):
     gbl.gSystem.AddDynamicPath(path)
 
 # add access to Python C-API headers
+_startup.begin('include_paths')
 apipath = sysconfig.get_path('include', 'posix_prefix' if os.name == 'posix' else os.name)
 if os.path.exists(apipath):
     add_include_path(apipath)
@@ -297,6 +494,7 @@ elif ispypy:
 
 # add access to extra headers for dispatcher (CPyCppyy only (?))
 if not ispypy:
+    _startup.begin('api_path')
     try:
         apipath_extra = os.environ['CPPYY_API_PATH']
         if os.path.basename(apipath_extra) == 'CPyCppyy':
@@ -304,6 +502,52 @@ if not ispypy:
     except KeyError:
         apipath_extra = None
 
+  # the result of the (slow) search below is memoized on disk, keyed on the
+  # version and install time of the CPyCppyy distribution
+    def _apipath_from_metadata():
+        import importlib.metadata as im, json
+
+        d = im.distribution('CPyCppyy')
+        files = d.files or []
+
+      # the RECORD file is (re)written on every install; its dist-info directory
+      # is named as normalized by the build backend, so look it up
+        key, cache = None, None
+        for f in files:
+            if f.name == 'RECORD' and f.parent.name.endswith('.dist-info'):
+                record = str(d.locate_file(f))
+                if os.path.exists(record):
+                    key = [d.version, sys.version, os.path.getmtime(record)]
+                    cache = os.path.join(os.environ.get('XDG_CACHE_HOME',
+                        os.path.join(os.path.expanduser('~'), '.cache')), 'cppyy', 'apipath.json')
+                break
+
+        if cache is not None:
+            try:
+                with open(cache) as fp:
+                    cached = json.load(fp)
+                if cached['key'] == key and \
+                        os.path.exists(os.path.join(cached['path'], 'CPyCppyy', 'API.h')):
+                    return cached['path'], None, key    # valid, no need to update
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                pass
+
+        for f in files:
+            if f.name == 'API.h' and f.parent.name == 'CPyCppyy':
+                ape = str(d.locate_file(f))
+                if os.path.exists(ape):
+                    return os.path.dirname(os.path.dirname(ape)), cache, key
+                break
+        return None, cache, key
+
+    apipath_cache, apipath_key = None, None
+    if apipath_extra is None:
+        try:
+            apipath_extra, apipath_cache, apipath_key = _apipath_from_metadata()
+        except Exception:
+            pass
+    del _apipath_from_metadata
+
     if apipath_extra is None:
         try:
             import pkg_resources as pr
@@ -352,8 +596,19 @@ if not ispypy:
             warnings.warn("CPyCppyy API not found (tried: %s); set CPPYY_API_PATH envar to the 'CPyCppyy' API directory to fix" % apipath_extra)
         else:
             add_include_path(apipath_extra)
+            if apipath_cache is not None:
+                try:
+                    import json
+                    if not os.path.isdir(os.path.dirname(apipath_cache)):
+                        os.makedirs(os.path.dirname(apipath_cache))
+                    with open(apipath_cache, 'w') as fp:
+                        json.dump({'key' : apipath_key, 'path' : apipath_extra}, fp)
+                    del json, fp
+                except (IOError, OSError):
+                    pass
 
-    del apipath_extra
+    del apipath_extra, apipath_cache, apipath_key
+    _startup.end()
 
 if os.getenv('CONDA_PREFIX'):
   # MacOS, Linux
@@ -369,6 +624,7 @@ include_path = os.path.abspath(os.path.join(os.path.dirname(__file__), *(4*[os.p
 if os.path.exists(include_path): add_include_path(include_path)
 
 del include_path, apipath, ispypy
+_startup.end()
 
 def add_autoload_map(fname):
     """Add the entries from a autoload (.rootmap) file to Cling."""
@@ -383,6 +639,37 @@ def set_debug(enable=True):
     else:
         gbl.CppyyLegacy.gDebug =  0
 
+def set_jit_cache(path, max_bytes=None):
+    """Cache the results of cppdef/include in directory <path> (None to disable),
+    limited to <max_bytes> in total, with least recently used entries evicted."""
+    if path is None:
+        _jitcache.disable()
+    else:
+        _jitcache.enable(gbl, path, max_bytes)
+
+def jit_cache_stats():
+    """Returns a dictionary of hits, misses, and size of the JIT results cache."""
+    return _jitcache.stats()
+
+if os.getenv('CPPYY_JIT_CACHE'):
+    set_jit_cache(os.getenv('CPPYY_JIT_CACHE'))
+
+def set_template_cache(path, replay=True):
+    """Record instantiated templated classes to file <path> (None to disable) and,
+    if <replay>, instantiate the classes recorded in earlier runs in bulk."""
+    if path is None:
+        _templcache.disable()
+    else:
+        return _templcache.enable(path, cppdef_many, replay)
+
+def template_cache_stats():
+    """Returns a dictionary with the number of recorded, replayed, and failed
+    templates, and the time taken by the replay."""
+    return _templcache.stats()
+
+if os.getenv('CPPYY_TEMPLATE_CACHE'):
+    set_template_cache(os.getenv('CPPYY_TEMPLATE_CACHE'))
+
 def _get_name(tt):
     if type(tt) == str:
         return tt
@@ -392,20 +679,88 @@ def _get_name(tt):
         ttname = tt.__name__
     return ttname
 
-_sizes = {}
+# sizes are cached by C++ name for strings, and weakly by type for classes,
+# so that the cache does not keep dynamically created classes alive
+_sizes = weakref.WeakKeyDictionary()
+_named_sizes = {}
+
+def _reflected_size(name):
+  # size from the reflection information, without generating code; returns 0
+  # if not available (TypeInfo_Size returns 1 for invalid and incomplete types,
+  # so these are rejected before trusting the size)
+    interp = gbl.gInterpreter
+    try:
+        ti = interp.TypeInfo_Factory(name)
+    except Exception:
+        return 0
+    try:
+        if not interp.TypeInfo_IsValid(ti):
+            return 0
+        ci = interp.ClassInfo_Factory(name)
+        try:
+            if interp.ClassInfo_IsValid(ci) and not interp.ClassInfo_IsLoaded(ci):
+                return 0                  # declared, but not defined
+        finally:
+            interp.ClassInfo_Delete(ci)
+        return max(interp.TypeInfo_Size(ti), 0)
+    finally:
+        interp.TypeInfo_Delete(ti)
+
+def _known_size(tt):
+  # returns (cache, size) with size 0 if it needs to be computed by Cling
+    cache = _named_sizes if type(tt) == str else _sizes
+    try:
+        return cache, cache[tt]
+    except (KeyError, TypeError):        # TypeError: not weakly referenceable
+        pass
+    try:
+        sz = ctypes.sizeof(tt)
+    except TypeError:
+        sz = _reflected_size(_get_name(tt))
+    if sz:
+        _cache_size(cache, tt, sz)
+    return cache, sz
+
+def _cache_size(cache, tt, sz):
+    try:
+        cache[tt] = sz
+    except TypeError:
+        pass
+
 def sizeof(tt):
     """Returns the storage size (in chars) of C++ type <tt>."""
     if not isinstance(tt, type) and not type(tt) == str:
         tt = type(tt)
-    try:
-        return _sizes[tt]
-    except KeyError:
-        try:
-            sz = ctypes.sizeof(tt)
-        except TypeError:
-            sz = gbl.gInterpreter.ProcessLine("sizeof(%s);" % (_get_name(tt),))
-        _sizes[tt] = sz
-        return sz
+    cache, sz = _known_size(tt)
+    if not sz:
+        sz = gbl.gInterpreter.ProcessLine("sizeof(%s);" % (_get_name(tt),))
+        if sz:                            # failed (e.g. incomplete): may be defined later
+            _cache_size(cache, tt, sz)
+    return sz
+
+_sizeof_many_count = [0]
+def sizeof_many(types):
+    """Returns the storage sizes (in chars) of C++ types <types> as a list; the
+    sizes that are not available from reflection are computed in a single
+    transaction."""
+    types = [(tt if isinstance(tt, type) or type(tt) == str else type(tt)) for tt in types]
+    sizes, missing = [], []
+    for i, tt in enumerate(types):
+        cache, sz = _known_size(tt)
+        if not sz:
+            missing.append((i, cache, tt))
+        sizes.append(sz)
+
+    if missing:
+        aname = 'sizeof_many%d' % _sizeof_many_count[0]
+        _sizeof_many_count[0] += 1
+        cppdef('namespace __cppyy_internal { unsigned long long %s[] = {%s}; }' %\
+               (aname, ', '.join(['sizeof(%s)' % _get_name(tt) for i, cache, tt in missing])))
+        computed = getattr(getattr(gbl, '__cppyy_internal'), aname)
+        for j, (i, cache, tt) in enumerate(missing):
+            sizes[i] = int(computed[j])
+            _cache_size(cache, tt, sizes[i])
+    return sizes
 
 _typeids = {}
 def typeid(tt):
@@ -432,9 +787,76 @@ def multi(*bases):      # after six, see also _typemap.py
             return nc_meta(name, bases, d)
     return type.__new__(faux_meta, 'faux_meta', (), {})
 
+def _split_scoped(name):
+  # split on '::', except for those in template arguments
+    parts, depth, last, i = [], 0, 0, 0
+    while i < len(name):
+        c = name[i]
+        if c == '<':
+            depth += 1
+        elif c == '>':
+            depth -= 1
+        elif c == ':' and depth == 0 and name[i+1:i+2] == ':':
+            parts.append(name[last:i])
+            last = i+2
+            i += 1
+        i += 1
+    parts.append(name[last:])
+    return [p for p in parts if p]
+
+def warm(names, members=True, freeze=False):
+    """Resolve the C++ classes, functions, and template instantiations in <names>
+    (with their pythonizations and, if <members>, all their members) up-front, for
+    the proxies to be shared copy-on-write with forked worker processes. If
+    <freeze>, all objects are moved to the permanent generation of the garbage
+    collector (see gc.freeze), for the remainder of the process."""
+    resolved = {}
+    for name in names:
+        obj = gbl
+        for part in _split_scoped(name):
+            obj = getattr(obj, part)
+        if members and isinstance(obj, type):
+            for attr in dir(obj):
+                try:
+                    getattr(obj, attr)
+                except Exception:
+                    pass
+        resolved[name] = obj
+
+    if freeze:
+      # move everything allocated so far out of reach of the garbage collector,
+      # which would otherwise write to (and thus copy) the pages in each child
+        import gc
+        gc.collect()
+        try:
+            gc.freeze()
+        except AttributeError:
+            pass          # Python < 3.7
+
+    return resolved
+
+def shared_pages():
+    """Returns the number of resident memory pages shared with other processes
+    (e.g. the parent of a forked worker) and private to this one (Linux only)."""
+    counts = {'shared' : 0, 'private' : 0}
+    fname = '/proc/self/smaps_rollup'
+    if not os.path.exists(fname):
+        fname = '/proc/self/smaps'
+    with open(fname) as smaps:
+        for line in smaps:
+            key, _, val = line.partition(':')
+            if key.startswith('Shared_'):
+                counts['shared']  += int(val.split()[0])
+            elif key.startswith('Private_'):
+                counts['private'] += int(val.split()[0])
+    pagesize = os.sysconf('SC_PAGE_SIZE')//1024
+    return dict((k, v//pagesize) for k, v in counts.items())
+
 
 #- workaround (TODO: may not be needed with Clang9) --------------------------
 if 'win32' in sys.platform:
     cppdef("""template<>
     std::basic_ostream<char, std::char_traits<char>>& __cdecl std::endl<char, std::char_traits<char>>(
         std::basic_ostream<char, std::char_traits<char>>&);""")
+
+_startup.finalize()
@@ -2,6 +2,8 @@
 """
 
 from . import _stdcpp_fix
+from . import _startup
+from . import _templcache
 from cppyy_backend import loader
 
 __all__ = [
@@ -18,9 +20,13 @@ __all__ = [
 
 # first load the dependency libraries of the backend, then pull in the
 # libcppyy extension module
+_startup.begin('load_cpp_backend')
 c = loader.load_cpp_backend()
+_startup.end()
+_startup.begin('libcppyy')
 import libcppyy as _backend
 _backend._cpp_backend = c
+_startup.end()
 
 # explicitly expose APIs from libcppyy
 import ctypes
@@ -60,10 +66,14 @@ class Template(object):  # expected/used by ProxyWrappers.cxx in CPyCppyy
     stl_fixed_size_types = ['std::array']
     stl_mapping_types    = ['std::map', 'std::unordered_map']
 
+    _integer_types = frozenset([int, bool])
+    _numeric_types = frozenset([int, bool, float])
+
     def __init__(self, name):
         self.__name__     = name
         self.__cpp_name__ = name
         self._instantiations = dict()
+        self._deductions     = dict()
 
     def __repr__(self):
         return "<cppyy.Template '%s' object at %s>" % (self.__name__, hex(id(self)))
@@ -85,57 +95,148 @@ class Template(object):  # expected/used by ProxyWrappers.cxx in CPyCppyy
             if type(arg) == str:
                 arg = ','.join(map(lambda x: x.strip(), arg.split(',')))
             newargs.append(arg)
+        t0 = _templcache._clock()
         pyclass = _backend.MakeCppTemplateClass(*newargs)
+        _templcache.record(pyclass, _templcache._clock()-t0)
 
       # memoize the class to prevent spurious lookups/re-pythonizations
         self._instantiations[args] = pyclass
 
       # special case pythonization (builtin_map is not available from the C-API)
         if 'push_back' in pyclass.__dict__ and not '__iadd__' in pyclass.__dict__:
-            if 'reserve' in pyclass.__dict__:
-                def iadd(self, ll):
+            value_type = self.__name__ == 'std::vector' and _value_type(pyclass) or None
+            if value_type in _buffer_typecodes:
+                def extend(self, ll, value_type=value_type):
+                    _vector_extend(self, ll, value_type)
+                def from_buffer(cls, buf, value_type=value_type):
+                    return _vector_from_buffer(cls, buf, value_type)
+                def from_iterable(cls, ll, value_type=value_type):
+                    return _vector_from_iterable(cls, ll, value_type)
+                pyclass.from_buffer   = classmethod(from_buffer)
+                pyclass.from_iterable = classmethod(from_iterable)
+            elif 'reserve' in pyclass.__dict__:
+                def extend(self, ll):
                     self.reserve(len(ll))
                     for x in ll: self.push_back(x)
-                    return self
             else:
-                def iadd(self, ll):
+                def extend(self, ll):
                     for x in ll: self.push_back(x)
-                    return self
+            def iadd(self, ll, extend=extend):
+                extend(self, ll)
+                return self
             pyclass.__iadd__ = iadd
+            if not 'extend' in pyclass.__dict__:
+                pyclass.extend = extend
 
       # back-pointer for reflection
         pyclass.__cpp_template__ = self
 
         return pyclass
 
+    _builtin_names = {int : 'int', float : 'double', bool : 'bool', str : 'std::string'}
+    def _arg_name(self, arg):
+        if type(arg) == str:
+            return ','.join(map(lambda x: x.strip(), arg.split(',')))
+        try:
+            return self._builtin_names[arg]
+        except (KeyError, TypeError):
+            pass
+        return getattr(arg, '__cpp_name__', None)
+
+    def instantiate_many(self, args_list):
+        """Instantiate this template for each entry in <args_list> (a single
+        template argument or a tuple of arguments) and return the classes."""
+        keys = [type(args) is tuple and args or (args,) for args in args_list]
+
+      # have Cling instantiate all new classes in a single transaction; errors
+      # are left for the individual lookups below to report
+        decls = []
+        for key in keys:
+            if key in self._instantiations:
+                continue
+            names = [self._arg_name(arg) for arg in key]
+            if None in names:
+                continue
+            decls.append('static_assert(sizeof(%s<%s>) != 0, "");' % (self.__cpp_name__, ','.join(names)))
+        if decls:
+            _begin_capture_stderr()
+            try:
+                gbl.gInterpreter.Declare('namespace __cppyy_internal {\n%s\n}' % '\n'.join(decls))
+            finally:
+                _end_capture_stderr()
+
+        return [self.__getitem__(key) for key in keys]
+
+    @staticmethod
+    def _deduce(types, first):
+      # a homogeneous container maps on its element type; mixed int/float is
+      # promoted to double; anything else falls back to the first element, in
+      # which case the result depends on order and can not be cached
+        unique = True
+        if len(types) == 1:
+            t = next(iter(types))
+        elif not types - Template._integer_types:
+            t = int
+        elif not types - Template._numeric_types:
+            t = float
+        else:
+            t, unique = type(first), False
+        if t is float: t = 'double'
+        return t, unique
+
     def __call__(self, *args):
       # for C++17, we're required to derive the type when using initializer syntax
       # (i.e. a tuple or list); not sure how to do that in general, but below the
-      # most common cases are covered
+      # most common cases are covered; the deduced class is cached by the types of
+      # the elements (unless deduction depends on their order)
         if args:
             args0 = args[0]
             if args0 and (type(args0) is tuple or type(args0) is list):
-                t = type(args0[0])
-                if t is float: t = 'double'
+                if self.__name__ in self.stl_unrolled_types:
+                    key = tuple(type(a) for a in args0)
+                    try:
+                        cls = self._deductions[key]
+                    except KeyError:
+                        cls = self._deductions[key] = self[key]
+                    return cls(*args0)
 
-                if self.__name__ in self.stl_sequence_types:
-                    return self[t](*args)
+                types = frozenset(map(type, args0))
                 if self.__name__ in self.stl_fixed_size_types:
-                    return self[t, len(args0)](*args)
-                if self.__name__ in self.stl_unrolled_types:
-                    return self[tuple(type(a) for a in args0)](*args0)
+                    key = (types, len(args0))
+                else:
+                    key = types
+                cls = self._deductions.get(key)
+                if cls is None:
+                    t, unique = self._deduce(types, args0[0])
+                    if self.__name__ in self.stl_sequence_types:
+                        cls = self[t]
+                    elif self.__name__ in self.stl_fixed_size_types:
+                        cls = self[t, len(args0)]
+                    if cls is not None and unique:
+                        self._deductions[key] = cls
+                if cls is not None:
+                    if len(args) == 1 and 'from_iterable' in cls.__dict__:
+                        return cls.from_iterable(args0)
+                    return cls(*args)
 
             if args0 and type(args0) is dict:
                 if self.__name__ in self.stl_mapping_types:
-                    try:
-                        pair = args0.items().__iter__().__next__()
-                    except AttributeError:
-                        pair = args0.items()[0]
-                    t1 = type(pair[0])
-                    if t1 is float: t1 = 'double'
-                    t2 = type(pair[1])
-                    if t2 is float: t2 = 'double'
-                    return self[t1, t2](*args)
+                    keytypes, valtypes = frozenset(map(type, args0.keys())), frozenset(map(type, args0.values()))
+                    key = (keytypes, valtypes)
+                    cls = self._deductions.get(key)
+                    if cls is None:
+                        try:
+                            pair = args0.items().__iter__().__next__()
+                        except AttributeError:
+                            pair = args0.items()[0]
+                        t1, unique1 = self._deduce(keytypes, pair[0])
+                        t2, unique2 = self._deduce(valtypes, pair[1])
+                        cls = self[t1, t2]
+                        if unique1 and unique2:
+                            self._deductions[key] = cls
+                    if len(args) == 1 and 'from_dict' in cls.__dict__:
+                        return cls.from_dict(args0)
+                    return cls(*args)
 
                 return self.__getitem__(*(type(a) for a in args0))(*args)
 
@@ -145,6 +246,540 @@ class Template(object):  # expected/used by ProxyWrappers.cxx in CPyCppyy
 _backend.Template = Template
 
 
+#- bulk insertion into std::vector -------------------------------------------
+import array, itertools, struct
+
+def _template_args(pyclass):
+  # top-level template arguments, from the full C++ name
+    name = pyclass.__cpp_name__
+    args, depth, start = [], 0, name.find('<')+1
+    for i in range(start, len(name)):
+        c = name[i]
+        if c == '<':
+            depth += 1
+        elif c == '>' and depth:
+            depth -= 1
+        elif (c == ',' or c == '>') and not depth:
+            args.append(name[start:i].strip())
+            if c == '>':
+                break
+            start = i+1
+    return args
+
+def _value_type(pyclass):
+  # first template argument, from the full C++ name
+    args = _template_args(pyclass)
+    return args and args[0] or None
+
+# element types that are returned as Python numbers (note that (u)int8_t are
+# mapped to integer types by _typemap, unlike the char types they alias)
+_vector_typecodes = {
+    'int8_t'      : 'b', 'uint8_t'            : 'B',
+    'short'       : 'h', 'unsigned short'     : 'H', 'int16_t'  : 'h', 'uint16_t' : 'H',
+    'int'         : 'i', 'unsigned int'       : 'I', 'int32_t'  : 'i', 'uint32_t' : 'I',
+    'long'        : 'l', 'unsigned long'      : 'L', 'int64_t'  : 'q', 'uint64_t' : 'Q',
+    'long long'   : 'q', 'unsigned long long' : 'Q', 'float'    : 'f', 'double'   : 'd',
+    }
+
+# char types are returned as 1-character str, so they only take part where the
+# raw memory is copied or viewed (buffers, bytes, NumPy), not the values
+_char_typecodes   = {'signed char' : 'b', 'unsigned char' : 'B'}
+_buffer_typecodes = dict(_vector_typecodes, **_char_typecodes)
+
+def _format_kind(c):
+    if c in 'efd':       return 'f'
+    if c in 'bhilqn':    return 'i'
+    if c in 'BHILQN':    return 'u'
+    return None
+
+def _buffer_matches(fmt, typecode):
+  # the buffer format needs to be a single element of the same kind and size
+    if not fmt:
+        return False
+    order = fmt[:-1]
+    if not order in ('', '@', '=', '<', '>', '!'):
+        return False
+    if order in ('<', '>', '!') and (order == '<') != (sys.byteorder == 'little'):
+        return False
+    return _format_kind(fmt[-1]) == _format_kind(typecode) and \
+        struct.calcsize(fmt) == struct.calcsize(typecode)
+
+_vector_insert = None
+def _get_vector_insert(value_type):
+    global _vector_insert
+    if _vector_insert is None:
+        gbl.gInterpreter.Declare("""namespace __cppyy_internal {
+            template<typename T>
+            void vector_extend(std::vector<T>& v, const void* data, size_t n) {
+                v.insert(v.end(), (const T*)data, (const T*)data+n);
+            }
+        }""")
+        _vector_insert = getattr(gbl, '__cppyy_internal').vector_extend
+    return _vector_insert[value_type]
+
+def _vector_extend_buffer(vec, ll, value_type):
+  # contiguous buffers of matching type are copied in a single call
+    try:
+        buf = memoryview(ll)
+    except TypeError:
+        return False
+    if buf.ndim != 1 or not buf.c_contiguous or \
+            not _buffer_matches(buf.format, _buffer_typecodes[value_type]):
+        return False
+    if len(buf):
+        _get_vector_insert(value_type)(vec, buf, len(buf))
+    return True
+
+def _vector_extend(vec, ll, value_type, chunksize=65536):
+    if _vector_extend_buffer(vec, ll, value_type):
+        return
+
+  # chars other than from buffers: the values are 1-char str or small ints
+    if value_type in _char_typecodes:
+        try:
+            vec.reserve(len(vec)+len(ll))
+        except TypeError:
+            pass
+        for x in ll: vec.push_back(x)
+        return
+
+    insert = _get_vector_insert(value_type)
+    typecode = _vector_typecodes[value_type]
+
+  # NumPy arrays of a different type that converts safely are converted by NumPy
+    if hasattr(ll, '__array_interface__') and getattr(ll, 'ndim', 0) == 1:
+        try:
+            conv = ll.astype(typecode, casting='safe')
+        except (TypeError, ValueError):
+            pass
+        else:
+            if _vector_extend_buffer(vec, conv, value_type):
+                return
+
+  # lists and tuples are converted in one go, by array.array in C
+    if type(ll) is list or type(ll) is tuple:
+        try:
+            chunk = array.array(typecode, ll)
+        except (TypeError, ValueError, OverflowError):
+            pass                  # handled below, for the proper partial result
+        else:
+            insert(vec, chunk, len(chunk))
+            return
+
+  # anything else is converted in chunks; on failure, the chunk is pushed back
+  # element-wise, for the same partial result and error as push_back in a loop
+    try:
+        vec.reserve(len(vec)+len(ll))
+    except TypeError:
+        pass                      # no len(), e.g. a generator
+    it = iter(ll)
+    while True:
+        items = list(itertools.islice(it, chunksize))
+        if not items:
+            break
+        try:
+            chunk = array.array(typecode, items)
+        except (TypeError, ValueError, OverflowError):
+            for x in items: vec.push_back(x)
+            continue
+        insert(vec, chunk, len(chunk))
+
+def _vector_from_buffer(cls, buf, value_type):
+    vec = cls()
+    if not _vector_extend_buffer(vec, buf, value_type):
+        raise TypeError('expected a contiguous buffer of %s' % value_type)
+    return vec
+
+def _vector_from_iterable(cls, ll, value_type):
+    vec = cls()
+    _vector_extend(vec, ll, value_type)
+    return vec
+
+
+#- bulk export of sequences --------------------------------------------------
+_sequence_copy = None
+def _get_sequence_copy(pyclass):
+    global _sequence_copy
+    if _sequence_copy is None:
+        gbl.gInterpreter.Declare("""#include <algorithm>
+        namespace __cppyy_internal {
+            template<typename C>
+            void sequence_copy(const C& c, void* out) {
+                std::copy(c.begin(), c.end(), (typename C::value_type*)out);
+            }
+        }""")
+        _sequence_copy = getattr(gbl, '__cppyy_internal').sequence_copy
+    return _sequence_copy[pyclass.__cpp_name__]
+
+def _add_bulk_export(pyclass):
+  # for sequences of builtin arithmetic types only (not std::vector<bool>)
+    value_type = _value_type(pyclass)
+    if not value_type in _buffer_typecodes or 'tolist' in pyclass.__dict__:
+        return
+    if value_type in _char_typecodes:
+        def tolist(self, value_type=value_type):
+          # same as element access, which returns chars as 1-character str
+            return list(_sequence_export(self, value_type).tobytes().decode('latin-1'))
+    else:
+        def tolist(self, value_type=value_type):
+            return _sequence_export(self, value_type).tolist()
+    def tobytes(self, value_type=value_type):
+        return _sequence_export(self, value_type).tobytes()
+    def to_numpy(self, copy=True, value_type=value_type):
+        return _sequence_to_numpy(self, value_type, copy)
+    pyclass.tolist   = tolist
+    pyclass.tobytes  = tobytes
+    pyclass.to_numpy = to_numpy
+
+def _sequence_export(seq, value_type):
+  # all elements are copied in a single call into a pre-sized array.array
+    typecode = _buffer_typecodes[value_type]
+    n = len(seq)
+    out = array.array(typecode, [0])*n
+    if n:
+        _get_sequence_copy(type(seq))(seq, out)
+    return out
+
+def _sequence_to_numpy(seq, value_type, copy):
+    import numpy as np
+    if not copy:
+        from cppyy.ll import as_numpy
+        return as_numpy(seq)
+    out = np.empty((len(seq),), dtype=_buffer_typecodes[value_type])
+    if len(out):
+        _get_sequence_copy(type(seq))(seq, out)
+    return out
+
+
+#- bulk conversion of std::map -----------------------------------------------
+_map_helpers = None
+def _get_map_helpers():
+    global _map_helpers
+    if _map_helpers is None:
+      # arithmetic keys/values are copied into typed arrays; strings are copied
+      # as an array of lengths and, in a second call, a single blob of chars
+        gbl.gInterpreter.Declare("""#include <cstring>
+        namespace __cppyy_internal {
+            template<typename T>
+            void map_put(void*& out, const T& t) { T* p = (T*)out; *p++ = t; out = p; }
+            inline void map_put(void*& out, const std::string& s) {
+                size_t* p = (size_t*)out; *p++ = s.size(); out = p;
+            }
+            template<typename T>
+            void map_put_blob(char*&, const T&) {}
+            inline void map_put_blob(char*& out, const std::string& s) {
+                memcpy(out, s.data(), s.size()); out += s.size();
+            }
+
+            template<typename T>
+            void map_get(const void*& in, const char*&, T& t) { const T* p = (const T*)in; t = *p++; in = p; }
+            inline void map_get(const void*& in, const char*& blob, std::string& s) {
+                const size_t* p = (const size_t*)in; s.assign(blob, *p); blob += *p++; in = p;
+            }
+
+            template<typename M>
+            void map_export(const M& m, void* keys, void* values) {
+                for (const auto& kv : m) { map_put(keys, kv.first); map_put(values, kv.second); }
+            }
+
+            template<typename M>
+            void map_export_blobs(const M& m, void* kblob, void* vblob) {
+                char* kb = (char*)kblob; char* vb = (char*)vblob;
+                for (const auto& kv : m) { map_put_blob(kb, kv.first); map_put_blob(vb, kv.second); }
+            }
+
+            template<typename M>
+            void map_import(M& m, const void* keys, const void* kblob,
+                                  const void* values, const void* vblob, size_t n) {
+                const char* kb = (const char*)kblob; const char* vb = (const char*)vblob;
+                for (size_t i = 0; i < n; ++i) {
+                    typename M::key_type k; typename M::mapped_type v;
+                    map_get(keys, kb, k); map_get(values, vb, v);
+                    m[std::move(k)] = std::move(v);
+                }
+            }
+        }""")
+        internal = getattr(gbl, '__cppyy_internal')
+        _map_helpers = (internal.map_export, internal.map_export_blobs, internal.map_import)
+    return _map_helpers
+
+_size_t_typecode = [c for c in 'ILQ' if struct.calcsize(c) == struct.calcsize('N')][0]
+
+def _is_string_type(name):
+    return name == 'std::string' or name.startswith('std::basic_string<char')
+
+def _map_column_typecode(name):
+  # typecode of the column array: element type, or lengths for strings
+    if _is_string_type(name):
+        return _size_t_typecode
+    return _vector_typecodes.get(name)
+
+def _add_map_bulk_conversion(pyclass):
+    args = _template_args(pyclass)
+    if len(args) < 2:
+        return
+    keytype, valtype = args[0], args[1]
+    if _map_column_typecode(keytype) is None or _map_column_typecode(valtype) is None:
+        return
+
+    def to_dict(self):
+        keys, values = _map_export(self, keytype, valtype)
+        return dict(zip(keys, values))
+    def from_dict(cls, d):
+        return _map_from_dict(cls, d, keytype, valtype)
+    def keys(self):
+        return _map_column(self, keytype, valtype, 0)
+    def values(self):
+        return _map_column(self, keytype, valtype, 1)
+    def items(self):
+        return _map_items(self, keytype, valtype)
+    pyclass.to_dict   = to_dict
+    pyclass.from_dict = classmethod(from_dict)
+    pyclass.keys      = keys
+    pyclass.values    = values
+    pyclass.items     = items
+
+def _split_blob(blob, lengths):
+    res, pos = [], 0
+    for n in lengths:
+        res.append(blob[pos:pos+n].decode('utf-8', 'replace'))
+        pos += n
+    return res
+
+def _map_export_arrays(m, keytype, valtype):
+  # the raw columns: typed arrays, with string columns as (lengths, blob)
+    export, export_blobs, _ = _get_map_helpers()
+    n = len(m)
+    keys   = array.array(_map_column_typecode(keytype), [0])*n
+    values = array.array(_map_column_typecode(valtype), [0])*n
+    if not n:
+        return keys, values, None, None
+    export[type(m).__cpp_name__](m, keys, values)
+
+    kblob = vblob = None
+    if _is_string_type(keytype) or _is_string_type(valtype):
+        kblob = bytearray(_is_string_type(keytype) and sum(keys)   or 1)
+        vblob = bytearray(_is_string_type(valtype) and sum(values) or 1)
+        export_blobs[type(m).__cpp_name__](m, kblob, vblob)
+    return keys, values, kblob, vblob
+
+def _map_export(m, keytype, valtype):
+    keys, values, kblob, vblob = _map_export_arrays(m, keytype, valtype)
+    keys   = _is_string_type(keytype) and _split_blob(kblob or b'', keys)   or keys.tolist()
+    values = _is_string_type(valtype) and _split_blob(vblob or b'', values) or values.tolist()
+    return keys, values
+
+def _map_column(m, keytype, valtype, idx):
+    cpptype = (keytype, valtype)[idx]
+    if not _is_string_type(cpptype):
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            column = _map_export_arrays(m, keytype, valtype)[idx]
+            return np.frombuffer(column, dtype=column.typecode) if len(column) else \
+                   np.empty((0,), dtype=column.typecode)
+    return _map_export(m, keytype, valtype)[idx]
+
+def _map_items(m, keytype, valtype):
+    if not _is_string_type(keytype) and not _is_string_type(valtype):
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            keys, values = _map_export_arrays(m, keytype, valtype)[:2]
+            items = np.empty((len(keys),), dtype=[('first', keys.typecode), ('second', values.typecode)])
+            if len(keys):
+                items['first']  = np.frombuffer(keys,   dtype=keys.typecode)
+                items['second'] = np.frombuffer(values, dtype=values.typecode)
+            return items
+    return list(zip(*_map_export(m, keytype, valtype)))
+
+def _map_pack(column, cpptype):
+  # typed array for arithmetic types; array of lengths and a blob for strings
+  # (blobs are bytearrays: bytes are not accepted as void*)
+    if _is_string_type(cpptype):
+        encoded = [x if type(x) is bytes else x.encode('utf-8') for x in column]
+        return array.array(_size_t_typecode, map(len, encoded)), bytearray(b''.join(encoded)) or bytearray(1)
+    return array.array(_vector_typecodes[cpptype], column), bytearray(1)
+
+def _map_from_dict(cls, d, keytype, valtype):
+    m = cls()
+    if not d:
+        return m
+    try:
+        keys,   kblob = _map_pack(d.keys(),   keytype)
+        values, vblob = _map_pack(d.values(), valtype)
+    except (TypeError, ValueError, OverflowError, AttributeError, UnicodeError):
+      # not representable in bulk; leave conversion (and errors) to the constructor
+        return cls(d)
+    try:
+        _get_map_helpers()[2][cls.__cpp_name__](m, keys, kblob, values, vblob, len(keys))
+    except Exception:
+        return cls(d)
+    return m
+
+
+#- std::tuple accessors ------------------------------------------------------
+_tuple_helpers = None
+def _get_tuple_helpers():
+    global _tuple_helpers
+    if _tuple_helpers is None:
+      # per-index accessors are instantiated for a specific tuple type, so that
+      # calls need no overload resolution; arithmetic elements are exported in
+      # a single call as 8-byte slots (long long, unsigned long long, or double)
+        gbl.gInterpreter.Declare("""#include <cstring>
+        #include <tuple>
+        #include <type_traits>
+        #include <utility>
+        namespace __cppyy_internal {
+            template<size_t I, typename T>
+            auto tuple_get(T& t) -> decltype(std::get<I>(t)) { return std::get<I>(t); }
+
+            template<typename E>
+            void tuple_put(char* out, const E& e) {
+                if (std::is_floating_point<E>::value) {
+                    double d = (double)e; memcpy(out, &d, sizeof(d));
+                } else if (std::is_signed<E>::value) {
+                    long long l = (long long)e; memcpy(out, &l, sizeof(l));
+                } else {
+                    unsigned long long u = (unsigned long long)e; memcpy(out, &u, sizeof(u));
+                }
+            }
+
+            template<typename T, size_t... I>
+            void tuple_export_impl(const T& t, char* out, std::index_sequence<I...>) {
+                int dummy[] = {0, (tuple_put(out+8*I, std::get<I>(t)), 0)...}; (void)dummy;
+            }
+
+            template<typename T>
+            void tuple_export(const T& t, void* out) {
+                tuple_export_impl(t, (char*)out, std::make_index_sequence<std::tuple_size<T>::value>{});
+            }
+        }""")
+        internal = getattr(gbl, '__cppyy_internal')
+        _tuple_helpers = (internal.tuple_get, internal.tuple_export)
+    return _tuple_helpers
+
+_tuple_slot_codes = {'f' : 'd', 'i' : 'q', 'u' : 'Q'}
+
+def _add_tuple_accessors(pyclass, size):
+    tuple_get, tuple_export = _get_tuple_helpers()
+    name = pyclass.__cpp_name__
+    elements = _template_args(pyclass)
+
+    getters = tuple(tuple_get[i, name] for i in range(size))
+  # builtin arithmetic elements are returned by value and need no life line
+    by_value = tuple(i < len(elements) and elements[i] in _vector_typecodes for i in range(size))
+
+    def tuple_getitem(self, idx, getters=getters, by_value=by_value):
+        if idx < 0:
+            idx += len(getters)
+        if 0 <= idx < len(getters):
+            res = getters[idx](self)
+            if not by_value[idx]:
+                try:
+                    res.__life_line = self
+                except Exception:
+                    pass
+            return res
+        raise IndexError(idx)
+    pyclass.__getitem__ = tuple_getitem
+
+    if size and len(elements) == size and all(by_value):
+        fmt = '='+''.join(_tuple_slot_codes[_format_kind(_vector_typecodes[e])] for e in elements)
+        export = tuple_export[name]
+        def astuple(self, fmt=fmt, export=export):
+            out = bytearray(8*len(fmt[1:]))
+            export(self, out)
+            return struct.unpack(fmt, out)
+    else:
+        def astuple(self):
+            return tuple(tuple_getitem(self, i) for i in range(size))
+    pyclass.astuple = astuple
+
+
+#- zero-copy access to std::string data --------------------------------------
+_string_data = None
+def _string_memoryview(s):
+    """Returns a writable memoryview of the chars of this std::string (no copy),
+    which keeps the string alive. Resizing the string invalidates the view."""
+    global _string_data
+    if _string_data is None:
+        gbl.gInterpreter.Declare("""namespace __cppyy_internal {
+            intptr_t string_data(std::string& s) { return (intptr_t)&s[0]; }
+        }""")
+        _string_data = getattr(gbl, '__cppyy_internal').string_data
+    n = s.size()
+    if n:
+        buf = (ctypes.c_char * n).from_address(_string_data(s))
+    else:
+        buf = (ctypes.c_char * 0)()
+    buf._cppyy_owner = s
+    return memoryview(buf).cast('B')
+
+def _string_tobytes(s):
+  # one copy, without decoding
+    return _string_memoryview(s).tobytes()
+
+
+#- zero-copy std::span and std::string_view from buffers ---------------------
+_view_assign = None
+def _get_view_assign(pyclass):
+    global _view_assign
+    if _view_assign is None:
+        gbl.gInterpreter.Declare("""namespace __cppyy_internal {
+            template<typename V>
+            void view_assign(V& v, const void* data, size_t n) {
+                v = V((typename V::pointer)data, n);
+            }
+        }""")
+        _view_assign = getattr(gbl, '__cppyy_internal').view_assign
+    return _view_assign[pyclass.__cpp_name__]
+
+_dynamic_extent = str(2**(8*struct.calcsize('N'))-1)
+
+def _add_buffer_init(pyclass, is_string_view):
+    writable = False
+    if is_string_view:
+        typecode = 'B'            # char-based only, see _standard_pythonizations
+    else:
+        args = _template_args(pyclass)
+        if not args:
+            return
+        element = args[0]
+        if 1 < len(args) and args[1].rstrip('uUlL') != _dynamic_extent:
+            return                # fixed extent: no size checks in C++
+        writable = not element.startswith('const ')
+        typecode = _buffer_typecodes.get(element.replace('const ', '', 1))
+        if typecode is None:
+            return
+
+  # buffers of matching element type are viewed directly, with a life line to
+  # the buffer; anything else goes to the C++ constructors as before
+    orig_init = pyclass.__init__
+    def __init__(self, *args):
+        if len(args) == 1 and not isinstance(args[0], str):
+            try:
+                buf = memoryview(args[0])
+            except TypeError:
+                buf = None
+            if buf is not None and buf.c_contiguous and \
+                    (_buffer_matches(buf.format, typecode) or \
+                     (is_string_view and buf.itemsize == 1)):
+                if writable and buf.readonly:
+                    raise TypeError('read-only buffer for %s' % pyclass.__cpp_name__)
+                orig_init(self)
+                if buf.nbytes:
+                    _get_view_assign(pyclass)(self, buf, buf.nbytes//buf.itemsize)
+                self.__cppyy_buffer__ = args[0]     # life line
+                return
+        orig_init(self, *args)
+    pyclass.__init__ = __init__
+
+
 #- :: and std:: namespaces ---------------------------------------------------
 gbl = _backend.CreateScopeProxy('')
 gbl.__class__.__repr__ = lambda cls : '<namespace cppyy.gbl at 0x%x>' % id(cls)
@@ -178,8 +813,10 @@ def add_default_paths():
                     gSystem.AddDynamicPath(f)
     except IOError:
         pass
+_startup.begin('add_default_paths')
 add_default_paths()
 del add_default_paths
+_startup.end()
 
 
 #- exports -------------------------------------------------------------------
@@ -0,0 +1,377 @@
+""" Persistent on-disk cache for the results of cppdef/include.
+
+Each cached entry is a dictionary library, generated with rootcling from the
+original source and compiled into a shared object. On a hit, the library is
+loaded and the source is declared from the entry's header, so that all names
+are available right away, while the code is taken from the library instead of
+being JIT-ed. Entries are keyed on a hash of the source, the headers it includes
+(path, mtime, and size), the include paths, EXTRA_CLING_ARGS, and the versions
+of cppyy and its backend. Eviction is least-recently-used, based on entry mtime.
+
+Entries are built by a separate process (this module, run as a script), so
+that a miss does not add compilation time to cppdef/include. Builds run one at
+a time, from a bounded queue that is worked off by a background thread. Sources that
+fail to build (e.g. because they depend on earlier interpreter state) leave a
+negative entry, so that they are not retried on every run. Sources that test
+(with #if, #ifdef, etc.) macros defined by earlier sources are not cached, as
+their compiled result depends on that earlier interpreter state.
+"""
+
+import hashlib, json, os, queue, re, shutil, subprocess, sys, tempfile, threading
+
+__all__ = [
+    'enable',
+    'disable',
+    'stats',
+    'load',
+    'store',
+    'wait',
+    ]
+
+
+_DEFAULT_MAX_BYTES = 512*1024*1024
+_FORMAT            = '2'              # bump when the layout of entries changes
+_FAILED            = 'FAILED'         # marker of a negative entry
+_MAX_PENDING       = 64               # builds queued; further misses are not stored
+
+_include_re = re.compile(r'^\s*#\s*include\s*([<"])([^>"]+)[>"]', re.M)
+_define_re  = re.compile(r'^\s*#\s*(?:define|undef)\s+([A-Za-z_]\w*)', re.M)
+_cond_re    = re.compile(r'^\s*#\s*(?:if|ifdef|ifndef|elif)\b(.*)$', re.M)
+_ident_re   = re.compile(r'[A-Za-z_]\w*')
+
+def _tested_macros(texts):
+    tested = set()
+    for text in texts:
+        for cond in _cond_re.findall(text):
+            tested.update(_ident_re.findall(cond))
+    tested.discard('defined')
+    return tested
+
+def _defined_macros(texts):
+    defined = set()
+    for text in texts:
+        defined.update(_define_re.findall(text))
+    return defined
+
+class _JitCache(object):
+    def __init__(self, gbl, path, max_bytes):
+        self.gbl       = gbl
+        self.path      = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.hits      = 0
+        self.misses    = 0
+        self.errors    = 0
+        self._seen     = set()
+        self._macros   = set()        # defined by sources declared so far
+        self._stateful = set()        # keys of sources that depend on those
+        self._pending  = set()        # keys of queued or running builds
+        self._queue    = None
+        self._lock     = threading.Lock()
+        self._pid      = None
+        self._versions = None
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def _include_flags(self):
+      # entries are added to the include path on load (the dictionaries refer to
+      # their header by name), so they are not part of the identity of the input
+        return [f for f in self.gbl.gInterpreter.GetIncludePath().replace('"', '').split()\
+                if not self.path in f]
+
+    def _dependencies(self, src, incflags, texts=None):
+      # path, mtime, and size of the headers included by <src>, so that an edit
+      # of any of those invalidates the entry; headers included with quotes are
+      # followed, system headers only to the first level (the text of <src> and
+      # of all headers read is collected in <texts>, if given)
+        incdirs = [os.getcwd()] + [f[2:] for f in incflags if f[:2] == '-I']
+        deps, todo, seen = [], [(src, None)], set()
+        while todo:
+            text, here = todo.pop()
+            if texts is not None:
+                texts.append(text)
+            for quote, name in _include_re.findall(text):
+                if here is not None and quote != '"':
+                    continue
+                for d in (here is not None and [here] or []) + incdirs:
+                    full = os.path.join(d, name)
+                    if os.path.isfile(full):
+                        break
+                else:
+                    continue              # e.g. found by Cling's own search paths
+                full = os.path.realpath(full)
+                if full in seen:
+                    continue
+                seen.add(full)
+                try:
+                    st = os.stat(full)
+                    deps.append('%s:%r:%d' % (full, st.st_mtime, st.st_size))
+                    with open(full, 'rb') as f:
+                        todo.append((f.read().decode('utf-8', 'replace'), os.path.dirname(full)))
+                except (IOError, OSError):
+                    pass
+        return deps
+
+    def _backend_versions(self):
+      # the backend version also pins the compiler flags used to build entries
+        if self._versions is None:
+            from ._version import __version__
+            versions = [__version__]
+            try:
+                import cppyy_backend
+                versions.append(cppyy_backend.__version__)
+            except (ImportError, AttributeError):
+                pass
+            try:
+                import importlib.metadata as im
+                versions.append(im.version('CPyCppyy'))
+            except Exception:
+                pass
+            self._versions = ' '.join(map(str, versions))
+        return self._versions
+
+    def key(self, kind, src, texts=None):
+        incflags = self._include_flags()
+        h = hashlib.sha1()
+        for part in [_FORMAT, kind, src, ' '.join(incflags),
+                     os.environ.get('EXTRA_CLING_ARGS', ''), os.environ.get('CXX', ''),
+                     self._backend_versions(), sys.version] + \
+                    self._dependencies(src, incflags, texts):
+            h.update(str(part).encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def _libname(self, key):
+        return os.path.join(self.path, key, 'lib%sDict.so' % key)
+
+    def load(self, kind, src):
+        texts = []
+        key = self.key(kind, src, texts)
+
+      # entries are built from the source alone, so source that tests macros
+      # defined by earlier sources would be built (and loaded) wrongly; macros
+      # that the source defines itself (e.g. include guards) are fine
+        defined  = _defined_macros(texts)
+        stateful = (_tested_macros(texts) - defined) & self._macros
+        self._macros.update(defined)
+        if stateful:
+            self._stateful.add(key)
+            return False
+
+      # identical input within the same process goes to Cling as normal, so that
+      # errors (e.g. duplicate definitions) are reported the same as without cache
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+
+        lib = self._libname(key)
+        if not os.path.exists(lib):
+            self.misses += 1
+            return False
+
+        self.gbl.gInterpreter.AddIncludePath(os.path.dirname(lib))
+        if self.gbl.gSystem.Load(lib) == -1:
+            self.errors += 1
+            return False
+
+      # the dictionary only provides autoloading of classes, so declare the
+      # source right away: functions, variables, and templates are used as soon
+      # as cppdef returns (their code is then found in the loaded library)
+        if not self.gbl.gInterpreter.Declare('#include "%s.h"' % key):
+            self.errors += 1
+            return False
+
+        try:
+            os.utime(os.path.dirname(lib), None)     # LRU bookkeeping
+        except OSError:
+            pass
+        self.hits += 1
+        return True
+
+    def _builder(self):
+        q = self._queue
+      # a single builder, so that many misses (e.g. at startup) do not result in
+      # as many simultaneous compilers
+        while True:
+            key, kind, src, incflags = q.get()
+            try:
+                self._build_one(key, kind, src, incflags)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                q.task_done()
+
+    def _build_one(self, key, kind, src, incflags):
+      # the sources are written here, in a private directory that the builder
+      # moves into place when done, so that processes never see a partial entry
+        tmpdir = tempfile.mkdtemp(prefix='.tmp', dir=self.path)
+        try:
+            with open(os.path.join(tmpdir, key+'.h'), 'w') as f:
+                f.write('#ifndef CPPYY_JIT_CACHE_%s\n#define CPPYY_JIT_CACHE_%s\n' % (key, key))
+                if kind == 'c_include':
+                    f.write('extern "C" {\n%s\n}\n' % src)
+                else:
+                    f.write(src+'\n')
+                f.write('#endif\n')
+
+            with open(os.path.join(tmpdir, 'job.json'), 'w') as f:
+                json.dump({'key'       : key,
+                           'incflags'  : incflags,
+                           'max_bytes' : self.max_bytes}, f)
+
+          # isolated mode (-I), as this package's directory would shadow the stdlib
+            with open(os.devnull, 'w') as devnull:
+                subprocess.call([sys.executable, '-I', os.path.abspath(__file__), tmpdir],
+                                stdout=devnull, stderr=devnull)
+        except (IOError, OSError):
+            self.errors += 1
+        shutil.rmtree(tmpdir, ignore_errors=True)  # moved into place, unless the builder died
+
+    def store(self, kind, src):
+        key = self.key(kind, src)
+        if key in self._stateful:
+            return False
+        if os.path.exists(os.path.join(self.path, key)):
+            return True               # built, or known to fail
+
+        with self._lock:
+            if key in self._pending:
+                return True
+            if _MAX_PENDING <= len(self._pending):
+                return False
+          # (re)start the builder thread, e.g. in a forked child
+            if self._pid != os.getpid():
+                self._pid, self._queue = os.getpid(), queue.Queue()
+                self._pending.clear()
+                t = threading.Thread(target=self._builder)
+                t.daemon = True
+                t.start()
+            self._pending.add(key)
+        self._queue.put((key, kind, src, self._include_flags()))
+        return True
+
+    def wait(self):
+        if self._queue is not None and self._pid == os.getpid():
+            self._queue.join()
+
+    def stats(self):
+        entries = _entries(self.path)
+        return {'path'    : self.path,
+                'hits'    : self.hits,
+                'misses'  : self.misses,
+                'errors'  : self.errors,
+                'pending' : len(self._pending),
+                'entries' : len([e for e in entries if not e[3]]),
+                'failed'  : len([e for e in entries if e[3]]),
+                'bytes'   : sum(e[1] for e in entries),
+                'max_bytes' : self.max_bytes}
+
+
+#- entry management, shared with the builder process ------------------------
+def _entries(path):
+    entries = []
+    for name in os.listdir(path):
+        if name.startswith('.'):
+            continue
+        full = os.path.join(path, name)
+        try:
+            files = os.listdir(full)
+            size = sum(os.path.getsize(os.path.join(full, f)) for f in files)
+            entries.append((os.path.getmtime(full), size, full, _FAILED in files))
+        except OSError:
+            pass                  # removed underneath us by another process
+    return entries
+
+def _evict(path, max_bytes):
+    entries = _entries(path)
+    total = sum(e[1] for e in entries)
+    for mtime, size, full, failed in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(full, ignore_errors=True)
+        total -= size
+
+def _compile(where, key, incflags):
+    linkdef = os.path.join(where, key+'Linkdef.h')
+    with open(linkdef, 'w') as f:
+        f.write("#ifdef __CLING__\n\n")
+        f.write("#pragma link C++ defined_in %s.h;\n" % key)
+        f.write("\n#endif")
+
+    subprocess.check_output(
+        [sys.executable, '-m', 'cppyy_backend._rootcling', '-f', key+'_rflx.cxx'] +\
+        incflags + [key+'.h', key+'Linkdef.h'],
+        cwd=where, stderr=subprocess.STDOUT)
+
+    cppflags = subprocess.check_output(
+        [sys.executable, '-m', 'cppyy_backend._cling_config', '--cppflags'])
+    cppflags = cppflags.decode('utf-8').split()
+    extra = os.environ.get('EXTRA_CLING_ARGS', '').split()
+    cxx = os.environ.get('CXX', 'c++').split()
+    subprocess.check_output(
+        cxx + cppflags + extra + incflags + ['-O2', '-fPIC', '-shared', '-I'+where,
+        '-o', 'lib%sDict.so' % key, key+'_rflx.cxx'],
+        cwd=where, stderr=subprocess.STDOUT)
+
+def _build(where):
+    with open(os.path.join(where, 'job.json')) as f:
+        job = json.load(f)
+    key = job['key']
+
+    try:
+        _compile(where, key, job['incflags'])
+    except Exception as e:
+      # leave a negative entry, with the error for inspection, in place of the
+      # library, so that the same source is not rebuilt (and fails) every run
+        output = getattr(e, 'output', None) or str(e)
+        for fn in os.listdir(where):
+            os.remove(os.path.join(where, fn))
+        with open(os.path.join(where, _FAILED), 'wb') as f:
+            f.write(output if isinstance(output, bytes) else output.encode('utf-8'))
+
+    try:
+        os.rename(where, os.path.join(os.path.dirname(where), key))
+    except OSError:
+        shutil.rmtree(where, ignore_errors=True)  # lost the race: entry exists
+
+    _evict(os.path.dirname(where), job['max_bytes'])
+
+
+_cache = None
+
+def enable(gbl, path, max_bytes=None):
+    global _cache
+    if max_bytes is None:
+        max_bytes = int(os.environ.get('CPPYY_JIT_CACHE_SIZE', _DEFAULT_MAX_BYTES))
+    if _cache is not None:
+        _cache.wait()
+    _cache = _JitCache(gbl, path, max_bytes)
+    _evict(_cache.path, max_bytes)
+
+def disable():
+    global _cache
+    if _cache is not None:
+        _cache.wait()
+    _cache = None
+
+def stats():
+    if _cache is None:
+        return None
+    return _cache.stats()
+
+def load(kind, src):
+    if _cache is None:
+        return False
+    return _cache.load(kind, src)
+
+def store(kind, src):
+    if _cache is None:
+        return False
+    return _cache.store(kind, src)
+
+def wait():
+    if _cache is not None:
+        _cache.wait()
+
+
+if __name__ == '__main__':
+    _build(sys.argv[1])
@@ -1,9 +1,12 @@
 """ Pythonization API.
 """
 
+import re, time
+
 __all__ = [
     'add_pythonization',
     'remove_pythonization',
+    'pythonization_stats',
     'pin_type',
     'add_type_reducer',
     ]
@@ -13,18 +16,201 @@ def _set_backend(backend):
     _backend = backend
 
 
+# registry of pythonizors: a single callback per scope is registered with the
+# backend, which dispatches to the pythonizors registered for that scope; those
+# created by the factories below carry their class regex (as 'match_class'),
+# which is indexed, so that they are only called for classes that match
+_clock = getattr(time, 'perf_counter', time.time)
+_literal_name = re.compile(r'[\w:<>, ]+$')
+
+def _exact_name(pattern):
+  # the name matched by a regex that only matches a single, literal, name
+    if pattern.endswith('$') and _literal_name.match(pattern[:-1]):
+        return pattern[:-1]
+    return None
+
+class _Entry(object):
+    __slots__ = ['pythonizor', 'scope', 'lazy', 'match', 'calls', 'time']
+    def __init__(self, pythonizor, scope, lazy):
+        self.pythonizor = pythonizor
+        self.scope      = scope
+        self.lazy       = lazy and hasattr(pythonizor, '_targets')
+        self.match      = getattr(pythonizor, 'match_class', None)
+        if not hasattr(self.match, 'match'):
+            self.match  = None
+        self.calls      = 0
+        self.time       = 0.
+
+class _Dispatcher(object):
+    def __init__(self, scope):
+        self.scope   = scope
+        self.entries = []
+        self._reindex()
+
+    def _reindex(self):
+        self.exact    = dict()        # literal class name -> entries
+        self.patterns = []            # entries with a general regex, w/o groups
+        self.grouped  = []            # entries with a regex that has groups
+        self.always   = False         # any plain callables?
+        for entry in self.entries:
+            if entry.match is None:
+                self.always = True
+                continue
+            name = _exact_name(entry.match.pattern)
+            if name is not None:
+                self.exact.setdefault(name, []).append(entry)
+            elif entry.match.groups:
+              # folding renumbers groups, changing the meaning of back references
+                self.grouped.append(entry)
+            else:
+                self.patterns.append(entry)
+
+      # combined matcher to reject, in one go, classes that no regex matches
+        self.combined = None
+        if self.patterns:
+            try:
+                self.combined = re.compile('|'.join(
+                    ['(?:%s)' % e.match.pattern for e in self.patterns]))
+            except re.error:           # e.g. incompatible flags: check one by one
+                pass
+
+    def add(self, pythonizor, lazy):
+        self.entries.append(_Entry(pythonizor, self.scope, lazy))
+        self._reindex()
+
+    def remove(self, pythonizor):
+        for i, entry in enumerate(self.entries):
+            if entry.pythonizor is pythonizor:
+                del self.entries[i]
+                self._reindex()
+                return True
+        return False
+
+    def __call__(self, klass, name):
+        selected = self.exact.get(name, [])
+        if self.patterns and (self.combined is None or self.combined.match(name)):
+            selected = selected + [e for e in self.patterns if e.match.match(name)]
+        if self.grouped:
+            selected = selected + [e for e in self.grouped if e.match.match(name)]
+        if not (selected or self.always):
+            return
+
+      # run in order of registration
+        for entry in self.entries:
+            if entry.match is not None and not entry in selected:
+                continue
+            if entry.lazy:
+                _defer(entry, klass, name)
+            else:
+                _run(entry, klass, name)
+
+def _run(entry, klass, name):
+    t0 = _clock()
+    try:
+        entry.pythonizor(klass, name)
+    finally:
+        entry.calls += 1
+        entry.time  += _clock() - t0
+
+
+# deferred pythonization: the members that a lazy pythonizor targets are (by
+# name only) replaced with placeholders; the first lookup of any of these, on
+# the class or an instance, puts back the originals and runs the pythonizor
+class _Deferred(object):
+    def __init__(self, entry, klass, name, targets):
+        self.entry   = entry
+        self.klass   = klass
+        self.name    = name
+        self.saved   = dict()
+        for k in targets:
+            self.saved[k] = klass.__dict__.get(k, _Deferred)    # sentinel: inherited
+            setattr(klass, k, _Placeholder(self, k))
+        self.applied = False
+
+    def apply(self):
+        if self.applied:
+            return
+        self.applied = True
+        for k, orig in self.saved.items():
+            current = self.klass.__dict__.get(k)
+            if not (isinstance(current, _Placeholder) and current.deferred is self):
+                continue          # replaced in the meantime: leave alone
+            if orig is _Deferred:
+                delattr(self.klass, k)
+            else:
+                setattr(self.klass, k, orig)
+        _run(self.entry, self.klass, self.name)
+
+class _Placeholder(object):
+    __slots__ = ['deferred', 'name']
+    def __init__(self, deferred, name):
+        self.deferred = deferred
+        self.name     = name
+
+    def __get__(self, obj, objtype=None):
+        self.deferred.apply()
+        return getattr(objtype if obj is None else obj, self.name)
+
+def _defer(entry, klass, name):
+    targets = list(entry.pythonizor._targets(klass))
+    if targets:
+        _Deferred(entry, klass, name, targets)
+
+_dispatchers = dict()
+
 # user-provided, general pythonizations
-def add_pythonization(pythonizor, scope = ''):
+def add_pythonization(pythonizor, scope = '', lazy = False):
     """<pythonizor> should be a callable taking two arguments: a class proxy,
     and its C++ name. It is called each time a named class from <scope> (the
     global one by default, but a relevant C++ namespace is recommended) is bound.
+    If <lazy>, pythonizors from the factories that modify existing methods
+    (set_method_property and policies, add_overload, and compose_method) are
+    only run on first lookup of one of the methods that they target.
     """
-    return _backend.add_pythonization(pythonizor, scope)
+    if not callable(pythonizor):
+        raise TypeError('pythonizor should be callable, not %s' % type(pythonizor).__name__)
+    try:
+        dispatcher = _dispatchers[scope]
+    except KeyError:
+        dispatcher = _dispatchers[scope] = _Dispatcher(scope)
+        _backend.add_pythonization(dispatcher, scope)
+    dispatcher.add(pythonizor, lazy)
 
 def remove_pythonization(pythonizor, scope = ''):
     """Remove previously registered <pythonizor> from <scope>.
     """
-    return _backend.remove_pythonization(pythonizor, scope)
+    try:
+        return _dispatchers[scope].remove(pythonizor)
+    except KeyError:
+        return False
+
+def pythonization_stats():
+    """Returns, per registered pythonizor, the number of calls and the total
+    time (in seconds) spent in it, for finding expensive pythonizors.
+    """
+    return [{'pythonizor' : e.pythonizor,
+             'scope'      : e.scope,
+             'calls'      : e.calls,
+             'time'       : e.time} for d in _dispatchers.values() for e in d.entries]
+
+
+def _matching_names(obj, match, own=False):
+  # names of the members of obj matched by regex <match>, without lookups; a
+  # literal name is taken as-is (it may not exist)
+    names = obj.__dict__ if own else None
+    exact = _exact_name(match.pattern)
+    if exact is not None:
+        return [exact] if (names is None or exact in names) else []
+    return [k for k in (dir(obj) if names is None else list(names)) if match.match(k)]
+
+def _matching_members(obj, match, own=False):
+  # (name, attribute) pairs of the members of obj matched by regex <match>: only
+  # the matched ones are looked up (avoiding lazy creation of all the others)
+    for k in _matching_names(obj, match, own):
+        try:
+            yield k, getattr(obj, k)
+        except Exception:
+            continue
 
 
 # prevent auto-casting (e.g. for interfaces)
@@ -56,6 +242,116 @@ def set_ownership_policy(match_class, match_method, python_owns_result):
                                '__creates__', int(python_owns_result))
 
 
+def set_bytes_policy(match_class, match_method):
+    """Return std::string results of matching methods as bytes rather than as
+    str; results are never decoded (by value, they are moved into a std::string
+    object in C++), so that binary data is returned unchanged.
+    """
+    class bytes_pythonizor(object):
+        def __init__(self, match_class, match_method):
+            import re
+            self.match_class = re.compile(match_class)
+            self.match_method = re.compile(match_method)
+
+        def __call__(self, obj, name):
+            if not self.match_class.match(name):
+                return
+            for k, f in list(_matching_members(obj, self.match_method, own=True)):
+                w = hasattr(f, '__overload__') and _bytes_wrapper(obj, f, k) or None
+                setattr(obj, k, _bytes_method(f, w))
+
+        def _targets(self, obj):
+            return _matching_names(obj, self.match_method, own=True)
+    return bytes_pythonizor(match_class, match_method)
+
+def _as_bytes(result):
+    if getattr(type(result), '__cpp_name__', None) == 'std::string':
+        return result.tobytes()
+    return result
+
+def _bytes_method(f, wrapper):
+    if wrapper is None:
+      # std::string objects (e.g. returned by reference) only
+        def h(self, *args, **kwargs):
+            return _as_bytes(f(self, *args, **kwargs))
+    else:
+        import cppyy
+        string = cppyy.gbl.std.string
+        def h(self, *args, **kwargs):
+            if kwargs:
+              # the wrapper has no parameter names to match keywords against, so
+              # go through the method itself; str results were decoded from UTF-8
+              # (undecodable ones are returned as bytes), so encode them back
+                result = _as_bytes(f(self, *args, **kwargs))
+                return result.encode('utf-8') if isinstance(result, str) else result
+            out = string()
+            return _as_bytes(wrapper(out, self, *args))
+    return h
+
+def _bytes_wrapper(klass, f, method):
+  # std::string results by value are moved into <out> and returned by reference,
+  # so that the backend does not convert them to str; others pass through as-is
+    def make_source(fname, cpp_name):
+        return """    template<typename... Args>
+    decltype(auto) %(fname)s(std::string& out, %(klass)s& self, Args&&... args) {
+        if constexpr (std::is_same<decltype(self.%(method)s(std::forward<Args>(args)...)), std::string>::value) {
+            out = self.%(method)s(std::forward<Args>(args)...);
+            return (std::string&)out;
+        } else
+            return self.%(method)s(std::forward<Args>(args)...);
+    }""" % {'fname' : fname, 'klass' : cpp_name, 'method' : method}
+    return _native_method(klass, f, method, ('bytes',), make_source)
+
+
+def set_container_policy(match_class, match_method, convert='python'):
+    """Convert STL container results of matching methods on return, with a
+    bulk copy where available: sequences to list (or to a NumPy array with
+    convert='numpy', if of arithmetic type), maps to dict, and tuples to tuple.
+    Results that can not be fully converted are returned unchanged.
+    """
+    if not convert in ('python', 'numpy'):
+        raise ValueError("convert should be 'python' or 'numpy', not %r" % (convert,))
+    use_numpy = convert == 'numpy'
+    def converted(self, result):
+        return _to_native(result, use_numpy)
+    return compose_method(match_class, match_method, converted)
+
+_std_sequences = ('std::vector<', 'std::array<', 'std::deque<', 'std::list<', 'std::set<')
+_std_mappings  = ('std::map<', 'std::unordered_map<')
+
+def _to_native(obj, use_numpy=False):
+    cls = type(obj)
+    name = getattr(cls, '__cpp_name__', '')
+    if not name.startswith('std::'):
+        return obj
+    if name == 'std::string':
+        return str(obj)
+
+  # bulk conversions, with a single call into C++
+    if hasattr(cls, 'to_dict'):
+        return obj.to_dict()
+    if use_numpy and hasattr(cls, 'to_numpy'):
+        return obj.to_numpy()
+    if hasattr(cls, 'tolist'):
+        return obj.tolist()
+
+  # element-wise for the rest, but only if no proxies to the elements remain,
+  # as those would not survive the (temporary) container
+    if hasattr(cls, 'astuple'):
+        res = tuple(_to_native(x, use_numpy) for x in obj.astuple())
+        elements = res
+    elif name.startswith(_std_sequences):
+        res = [_to_native(x, use_numpy) for x in obj]
+        elements = res
+    elif name.startswith(_std_mappings):
+        res = dict((_to_native(k, use_numpy), _to_native(v, use_numpy)) for k, v in obj)
+        elements = list(res.keys()) + list(res.values())
+    else:
+        return obj
+    if any(hasattr(type(x), '__cpp_name__') for x in elements):
+        return obj
+    return res
+
 # NB: Ideally, we'd use the version commented out below, but for now, we
 #     make do with the hackier version here.
 def rename_attribute(match_class, orig_attribute, new_attribute, keep_orig=False):
@@ -88,11 +384,10 @@ def rename_attribute(match_class, orig_attribute, new_attribute, keep_orig=False
         def __call__(self, obj, name):
             if not self.match_class.match(name):
                 return
-            for k in dir(obj): #.__dict__:
-                if self.match_attr.match(k):
-                    tmp = property(self.getter(k), self.setter(k), self.deleter(k))
-                    setattr(obj, self.new_attr, tmp)
-                    #if not self.keep_orig: delattr(obj, k)
+            for k, tmp in _matching_members(obj, self.match_attr):
+                tmp = property(self.getter(k), self.setter(k), self.deleter(k))
+                setattr(obj, self.new_attr, tmp)
+                #if not self.keep_orig: delattr(obj, k)
     return attribute_pythonizor(match_class, orig_attribute, new_attribute, keep_orig)
 
 # def rename_attribute(match_class, orig_attribute, new_attribute, keep_orig=False):
@@ -133,46 +428,184 @@ def add_overload(match_class, match_method, overload):
         def __call__(self, obj, name):
             if not self.match_class.match(name):
                 return
-            for k in dir(obj): #.__dict__:
-               try:
-                   tmp = getattr(obj, k)
-               except:
-                   continue
-               if self.match_method.match(k):
-                   try:
-                       tmp.__add_overload__(overload)
-                   except AttributeError: pass
+            for k, tmp in _matching_members(obj, self.match_method):
+                try:
+                    tmp.__add_overload__(overload)
+                except AttributeError: pass
+
+        def _targets(self, obj):
+            return [k for k in _matching_names(obj, self.match_method) if hasattr(obj, k)]
     return method_pythonizor(match_class, match_method, overload)
 
 
 def compose_method(match_class, match_method, g):
+    """Replace matching methods f with g(self, f(self, ...)). If <g> is a C++
+    function, or the C++ source of a callable (e.g. a lambda), the composition
+    is JIT-ed into a C++ function template, which is bound as the method, so
+    that calls remain entirely in C++.
+    """
     class composition_pythonizor(object):
         def __init__(self, match_class, match_method, g):
             import re
             self.match_class = re.compile(match_class)
             self.match_method = re.compile(match_method)
             self.g = g
+            if type(g) is str:
+                self.native = g
+            elif hasattr(g, '__overload__'):
+                self.native = g.__cpp_name__
+            else:
+                self.native = None
 
         def __call__(self, obj, name):
             if not self.match_class.match(name):
                 return
             g = self.g
-            for k in obj.__dict__:
-                if not self.match_method.match(k):
-                    continue
-                try:
-                    f = getattr(obj, k)
-                except:
-                    continue
-                def make_fun(f, g):
-                    def h(self, *args, **kwargs):
-                        return g(self, f(self, *args, **kwargs))
-                    return h
-                h = make_fun(f, g)
+            for k, f in list(_matching_members(obj, self.match_method, own=True)):
+                h = None
+                if self.native is not None and hasattr(f, '__overload__'):
+                    h = _native_composition(obj, f, k, self.native)
+                if h is None:
+                    if type(g) is str:
+                        g = _cpp_callable(g)
+                    def make_fun(f, g):
+                        def h(self, *args, **kwargs):
+                            return g(self, f(self, *args, **kwargs))
+                        return h
+                    h = make_fun(f, g)
                 setattr(obj, k, h)
+
+        def _targets(self, obj):
+            return _matching_names(obj, self.match_method, own=True)
     return composition_pythonizor(match_class, match_method, g)
 
 
+_native_compositions = dict()
+_plain_method = re.compile(r'[A-Za-z_]\w*$')
+_arg_name     = re.compile(r'(.*[\s*&>\]])([A-Za-z_]\w*)$')
+_type_words   = set(['signed', 'unsigned', 'short', 'long', 'int', 'char', 'bool', 'float', 'double'])
+_qualifiers   = set(['const', 'volatile', 'struct', 'class', 'enum', 'typename'])
+
+def _split_top_level(s, sep):
+  # split <s> on <sep>, but not inside template arguments, parentheses, or quotes
+    parts, depth, start, quote = [], 0, 0, None
+    for i, c in enumerate(s):
+        if quote:
+            if c == quote and s[i-1] != '\\':
+                quote = None
+        elif c in '"\'':
+            quote = c
+        elif c in '<([':
+            depth += 1
+        elif c in '>)]':
+            depth -= 1
+        elif c == sep and not depth:
+            parts.append(s[start:i])
+            start = i+1
+    parts.append(s[start:])
+    return parts
+
+def _overload_arg_types(f, method):
+  # argument types of all overloads of <f>, from their prototypes, as listed in
+  # its __doc__ (e.g. 'int ns::Klass::method(int a, double b = 1.) const');
+  # returns None if any of them can not be parsed
+    overloads = []
+    for proto in (getattr(f, '__doc__', None) or '').split('\n'):
+        proto = proto.strip()
+        if not proto:
+            continue
+        start = proto.find('::%s(' % method)
+        if start < 0:
+            return None
+        start += len(method)+3
+        args, depth = proto[start:], 1
+        for i, c in enumerate(args):
+            depth += (c == '(') - (c == ')')
+            if not depth:
+                break
+        else:
+            return None
+        types = []
+        for arg in _split_top_level(args[:i], ','):
+            arg = _split_top_level(arg, '=')[0].strip()   # drop default value
+            if not arg:
+                continue
+            m = _arg_name.match(arg)
+            if m and not m.group(2) in _type_words and \
+                    not set(m.group(1).split()) <= _qualifiers:
+                arg = m.group(1).strip()                   # drop argument name
+            types.append(arg)
+        overloads.append(types)
+    return overloads or None
+
+def _native_method(klass, f, method, key, make_source):
+  # JIT a function template wrapping <method> of <klass>, with the C++ source
+  # from make_source(template name, C++ class name); the template is explicitly
+  # instantiated for the argument types of all overloads, so that any errors
+  # show up here rather than on first call; returns None if not possible (e.g.
+  # operators, or overloads that can not be determined), for the caller to fall
+  # back on Python
+    try:
+        cpp_name = klass.__cpp_name__
+    except AttributeError:
+        return None
+    if method.startswith('__') or not _plain_method.match(method):
+        return None
+
+    key = (cpp_name, method) + key
+    try:
+        return _native_compositions[key]
+    except KeyError:
+        pass
+
+    h = None
+    overloads = _overload_arg_types(f, method)
+    if overloads:
+        import cppyy
+        fname = 'native_method%d' % len(_native_compositions)
+        checks = ['static auto* %s_check%d = &%s<%s>;' % (fname, i, fname, ', '.join(types))\
+                  for i, types in enumerate(overloads)]
+        try:
+            cppyy.cppdef("""#include <type_traits>
+#include <utility>
+namespace __cppyy_internal {
+%s
+%s
+}""" % (make_source(fname, cpp_name), '\n'.join(checks)))
+            h = getattr(getattr(cppyy.gbl, '__cppyy_internal'), fname)
+        except (SyntaxError, AttributeError):
+            pass
+    _native_compositions[key] = h
+    return h
+
+def _native_composition(klass, f, method, g_src):
+  # the composition as a C++ function template taking the object as its first
+  # argument, with the arguments perfectly forwarded (for out-parameters and
+  # move-only types); the backend instantiates it for the actual argument types
+  # on first use and dispatches to the instantiation from then on
+    def make_source(fname, cpp_name):
+        return """    template<typename... Args>
+    decltype(auto) %s(%s& self, Args&&... args) {
+        return (""" % (fname, cpp_name) + g_src + """)(self, self.%s(std::forward<Args>(args)...));
+    }""" % method
+    return _native_method(klass, f, method, ('compose', g_src), make_source)
+
+def _cpp_callable(g_src):
+  # C++ source of a callable as an object callable from Python
+    key = (None, None, g_src)
+    try:
+        return _native_compositions[key]
+    except KeyError:
+        pass
+
+    import cppyy
+    vname = 'compose_callable%d' % len(_native_compositions)
+    cppyy.cppdef('namespace __cppyy_internal { auto %s = %s; }' % (vname, g_src))
+    g = getattr(getattr(cppyy.gbl, '__cppyy_internal'), vname)
+    _native_compositions[key] = g
+    return g
+
+
 def set_method_property(match_class, match_method, prop, value):
     class method_pythonizor(object):
         def __init__(self, match_class, match_method, prop, value):
@@ -185,13 +618,11 @@ def set_method_property(match_class, match_method, prop, value):
         def __call__(self, obj, name):
             if not self.match_class.match(name):
                 return
-            for k in dir(obj): #.__dict__:
-                try:
-                    tmp = getattr(obj, k)
-                except:
-                    continue
-                if self.match_method.match(k):
-                    setattr(tmp, self.prop, self.value)
+            for k, tmp in _matching_members(obj, self.match_method):
+                setattr(tmp, self.prop, self.value)
+
+        def _targets(self, obj):
+            return [k for k in _matching_names(obj, self.match_method) if hasattr(obj, k)]
     return method_pythonizor(match_class, match_method, prop, value)
 
 
@@ -229,7 +660,16 @@ def make_property(match_class, match_get, match_set=None, match_del=None, prop_n
 
             self.prop_name = prop_name
 
-        def make_get_del_proxy(self, getter):
+        def make_get_del_proxy(self, getter, meth=None):
+          # C++ methods are used directly, as unbound methods taking the object
+          # as first argument: the property then calls into C++ with no Python
+          # frame in between; getters are resolved to their overload up-front
+            if hasattr(meth, '__overload__'):
+                try:
+                    return meth.__overload__('')
+                except Exception:
+                    return meth
+
             class proxy(object):
                 def __init__(self, getter):
                     self.getter = getter
@@ -238,7 +678,10 @@ def make_property(match_class, match_get, match_set=None, match_del=None, prop_n
                     return getattr(obj, self.getter)()
             return proxy(getter)
 
-        def make_set_proxy(self, setter):
+        def make_set_proxy(self, setter, meth=None):
+            if hasattr(meth, '__overload__'):
+                return meth
+
             class proxy(object):
                 def __init__(self, setter):
                     self.setter = setter
@@ -247,6 +690,28 @@ def make_property(match_class, match_get, match_set=None, match_del=None, prop_n
                     return getattr(obj, self.setter)(arg)
             return proxy(setter)
 
+        def honor_overrides(self, klass, prop_name, accessors):
+          # the C++ accessors, used directly, bypass overrides in Python-derived
+          # classes; on derivation, such classes get a property with proxies
+            props = klass.__dict__.get('__cppyy_properties__')
+            if props is None:
+                props = dict()
+                klass.__cppyy_properties__ = props
+                make_get_del_proxy, make_set_proxy = self.make_get_del_proxy, self.make_set_proxy
+                def __init_subclass__(cls, **kwds):
+                    super(klass, cls).__init_subclass__(**kwds)
+                    derived = cls.__mro__[:cls.__mro__.index(klass)]
+                    for prop_name, (getter, setter, deleter) in props.items():
+                        if any(prop_name in vars(c) for c in derived) or \
+                           not any(n in vars(c) for c in derived for n in (getter, setter, deleter) if n):
+                            continue
+                        setattr(cls, prop_name, property(
+                            getter  and make_get_del_proxy(getter) or None,
+                            setter  and make_set_proxy(setter) or None,
+                            deleter and make_get_del_proxy(deleter) or None))
+                klass.__init_subclass__ = classmethod(__init_subclass__)
+            props[prop_name] = tuple(accessors)
+
         def __call__(self, obj, name):
             if not self.match_class.match(name):
                 return
@@ -258,54 +723,47 @@ def make_property(match_class, match_get, match_set=None, match_del=None, prop_n
 
             if not self.match_many:
                 fget, fset, fdel = None, None, None
+                accessors = [None, None, None]
 
-            for k in dir(obj): #.__dict__:
+            for k, tmp in _matching_members(obj, self.match_get):
                 match = self.match_get.match(k)
-                try:
-                    tmp = getattr(obj, k)
-                except:
-                    continue
-                if match and hasattr(tmp, '__call__'):
+                if hasattr(tmp, '__call__'):
                     if self.match_many:
                         name = match.group(1)
-                        named_getters[name] = k
+                        named_getters[name] = (k, tmp)
                     else:
-                        fget = self.make_get_del_proxy(k)
+                        fget = self.make_get_del_proxy(k, tmp)
+                        accessors[0] = k
                         break
 
             if self.match_set:
-                for k in dir(obj): #.__dict__:
+                for k, tmp in _matching_members(obj, self.match_set):
                     match = self.match_set.match(k)
-                    try:
-                        tmp = getattr(obj, k)
-                    except:
-                        continue
-                    if match and hasattr(tmp, '__call__'):
+                    if hasattr(tmp, '__call__'):
                         if self.match_many:
                             name = match.group(1)
-                            named_setters[name] = k
+                            named_setters[name] = (k, tmp)
                         else:
-                            fset = self.make_set_proxy(k)
+                            fset = self.make_set_proxy(k, tmp)
+                            accessors[1] = k
                             break
 
             if self.match_del:
-                for k in dir(obj): #.__dict__:
+                for k, tmp in _matching_members(obj, self.match_del):
                     match = self.match_del.match(k)
-                    try:
-                        tmp = getattr(obj, k)
-                    except:
-                        continue
-                    if match and hasattr(tmp, '__call__'):
+                    if hasattr(tmp, '__call__'):
                         if self.match_many:
                             name = match.group(1)
-                            named_deleters[name] = k
+                            named_deleters[name] = (k, tmp)
                         else:
-                            fdel = self.make_get_del_proxy(k)
+                            fdel = self.make_get_del_proxy(k, tmp)
+                            accessors[2] = k
                             break
 
             if not self.match_many:
                 new_prop = property(fget, fset, fdel)
                 setattr(obj, self.prop_name, new_prop)
+                self.honor_overrides(obj, self.prop_name, accessors)
                 return
 
             names += list(named_getters.keys())
@@ -315,18 +773,22 @@ def make_property(match_class, match_get, match_set=None, match_del=None, prop_n
 
             properties = []
             for name in names:
+                accessors = [None, None, None]
                 if name in named_getters:
-                    fget = self.make_get_del_proxy(named_getters[name])
+                    fget = self.make_get_del_proxy(*named_getters[name])
+                    accessors[0] = named_getters[name][0]
                 else:
                     fget = None
 
                 if name in named_setters:
-                    fset = self.make_set_proxy(named_setters[name])
+                    fset = self.make_set_proxy(*named_setters[name])
+                    accessors[1] = named_setters[name][0]
                 else:
                     fset = None
 
                 if name in named_deleters:
-                    fdel = self.make_get_del_proxy(named_deleters[name])
+                    fdel = self.make_get_del_proxy(*named_deleters[name])
+                    accessors[2] = named_deleters[name][0]
                 else:
                     fdel = None
 
@@ -337,6 +799,7 @@ def make_property(match_class, match_get, match_set=None, match_del=None, prop_n
                     prop_name = name
 
                 setattr(obj, prop_name, new_prop)
+                self.honor_overrides(obj, prop_name, accessors)
 
     return property_pythonizor(match_class, match_get, match_set, match_del, prop_name)
 
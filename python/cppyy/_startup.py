@@ -0,0 +1,89 @@
+""" Startup-time profiling of 'import cppyy'.
+
+Set the envar CPPYY_PROFILE_STARTUP to '1' (or 'table') to have the wall time
+and resident memory delta of each phase printed to stderr at the end of the
+import, to 'json' for JSON output instead, or to any other value to have the
+JSON written to a file by that name.
+"""
+
+import os, sys, time
+
+__all__ = [
+    'begin',
+    'end',
+    'report',
+    'finalize',
+    ]
+
+
+_setting = os.environ.get('CPPYY_PROFILE_STARTUP', '')
+enabled  = _setting not in ('', '0')
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+def _rss():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, AttributeError):
+        pass
+    try:            # peak rather than current, but good enough as fallback
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return 'darwin' in sys.platform and rss or rss*1024
+    except ImportError:
+        return 0
+
+
+# recorded in order of start; nested phases are named 'outer.inner' (the first
+# phase, 'total', covers the full import and is not used as prefix)
+phases = []
+_active = []
+
+def begin(name):
+    if not enabled:
+        return
+    if 1 < len(_active):
+        name = _active[-1]['phase']+'.'+name
+    entry = {'phase' : name, 'time' : _clock(), 'rss' : _rss()}
+    phases.append(entry)
+    _active.append(entry)
+
+def end():
+    if not enabled:
+        return
+    entry = _active.pop()
+    entry['time'] = _clock() - entry['time']
+    entry['rss']  = _rss()  - entry['rss']
+
+begin('total')
+
+
+def report(fmt=None, out=None):
+    """Write the recorded phases as a table or as JSON to <out>."""
+    if fmt is None:
+        fmt = _setting in ('1', 'table') and 'table' or 'json'
+    if out is None:
+        out = sys.stderr
+
+    done = [p for p in phases if not p in _active]
+    if fmt == 'json':
+        import json
+        json.dump(done, out, indent=2)
+        out.write('\n')
+        return
+
+    width = max([len(p['phase']) for p in done]+[5])
+    out.write('%-*s  %10s  %12s\n' % (width, 'phase', 'time (ms)', 'rss (kB)'))
+    for p in done:
+        out.write('%-*s  %10.2f  %12d\n' % (width, p['phase'], 1000.*p['time'], p['rss']//1024))
+
+def finalize():
+    if not enabled:
+        return
+    end()
+    if _setting in ('1', 'table', 'json'):
+        report()
+    else:
+        with open(_setting, 'w') as out:
+            report('json', out)
@@ -0,0 +1,130 @@
+""" Template instantiation cache, persisted across processes.
+
+The C++ names of all templated classes instantiated through Template.__getitem__
+are recorded, together with the time that took, and written to file at exit.
+On startup, the recorded instantiations are replayed in bulk in a single
+transaction (which can be cached in turn by the JIT results cache), leaving
+only the creation of the Python proxies for later use. Names that fail to
+replay (e.g. because their arguments are not yet declared) are kept in the file
+as negative entries (with a null time), so that they are neither replayed nor
+recorded again by later processes.
+"""
+
+import atexit, json, os, time
+
+__all__ = [
+    'enable',
+    'disable',
+    'record',
+    'stats',
+    ]
+
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+class _TemplateCache(object):
+    def __init__(self, path):
+        self.path     = os.path.abspath(path)
+        self.recorded = dict()
+        self.failed   = set()
+        self.replay   = {'replayed' : 0, 'failed' : 0, 'time' : 0.}
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def save(self):
+        if not self.recorded and not self.failed:
+            return
+        known = self.load()
+        known.update(self.recorded)
+        for name in self.failed:
+            known[name] = None
+        tmp = '%s.%d' % (self.path, os.getpid())
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(known, f, indent=0, sort_keys=True)
+            os.rename(tmp, self.path)       # atomic, for concurrent processes
+        except (IOError, OSError):
+            pass
+
+    def run_replay(self, cppdef_many):
+        from . import _fragment_tag
+        known = self.load()
+        names = sorted(name for name, elapsed in known.items() if elapsed is not None)
+        self.failed = set(name for name, elapsed in known.items() if elapsed is None)
+        if not names:
+            return
+
+      # forcing the class (not its members) to be instantiated is enough for
+      # the later lookup; failures drop the offending names and retry the rest
+        t0 = _clock()
+        fragments = ['namespace __cppyy_internal { static_assert(sizeof(%s) != 0, ""); }' % name\
+                     for name in names]
+        failed, remaining = set(), list(range(len(fragments)))
+        while remaining:
+            try:
+                cppdef_many([fragments[i] for i in remaining])
+                break
+            except SyntaxError as e:
+                bad = set(remaining[int(i)] for i in _fragment_tag.findall(str(e)))
+                if not bad:
+                    bad = set(remaining)
+                failed |= bad
+                remaining = [i for i in remaining if not i in bad]
+        elapsed = _clock() - t0
+
+      # failed names are marked as such in the file, and not recorded again, so
+      # that they are not retried (and fail) on every other startup
+        failed = set(name for i, name in enumerate(names) if i in failed)
+        self.failed |= failed
+        self.replay['replayed'] = len(names) - len(failed)
+        self.replay['failed']   = len(failed)
+        self.replay['time']     = elapsed
+
+    def record(self, pyclass, elapsed):
+        try:
+            name = pyclass.__cpp_name__
+        except AttributeError:
+            return
+        if not name in self.recorded and not name in self.failed:
+            self.recorded[name] = elapsed
+
+    def stats(self):
+        st = dict(self.replay)
+        st['path']     = self.path
+        st['recorded'] = len(self.recorded)
+        return st
+
+
+_cache = None
+
+def _save():
+    if _cache is not None:
+        _cache.save()
+atexit.register(_save)
+
+def enable(path, cppdef_many, replay=True):
+    global _cache
+    _save()                 # in case of switching files
+    _cache = _TemplateCache(path)
+    if replay:
+        _cache.run_replay(cppdef_many)
+    return _cache.stats()
+
+def disable():
+    global _cache
+    _save()
+    _cache = None
+
+def record(pyclass, elapsed):
+    if _cache is not None:
+        _cache.record(pyclass, elapsed)
+
+def stats():
+    if _cache is None:
+        return None
+    return _cache.stats()
@@ -24,6 +24,7 @@ __all__ = [
     'free',
     'array_new',
     'array_delete',
+    'as_numpy',
     'signals_as_exception',
     'set_signals_as_exception',
     'FatalError',
@@ -117,6 +118,133 @@ free             = cppyy.gbl.free      # for symmetry
 array_new        = ArraySizer(cppyy.gbl.__cppyy_internal.cppyy_array_new)
 array_delete     = cppyy.gbl.__cppyy_internal.cppyy_array_delete
 
+# zero-copy NumPy views of STL containers
+cppyy.cppdef("""namespace __cppyy_internal {
+    template<typename C>
+    intptr_t cppyy_element_address(C& c, size_t i) { return (intptr_t)&c[i]; }
+
+    template<typename C>
+    bool cppyy_is_contiguous(C& c) {
+        if (c.empty()) return true;
+        auto first = &c[0];
+        for (size_t i = 1; i < c.size(); ++i) {
+            if (&c[i] != first+i) return false;
+        }
+        return true;
+    }
+}""")
+
+class _ArrayView(object):
+  # the resulting ndarray holds on to this object (as its base), which in turn
+  # holds on to the owning container
+    def __init__(self, owner, address, size, dtype):
+        self.owner = owner
+        self.__array_interface__ = {
+            'data'    : (address, False),
+            'shape'   : (size,),
+            'typestr' : dtype.str,
+            'version' : 3 }
+
+_checked_view = None
+def _get_checked_view(np):
+    global _checked_view
+    if _checked_view is not None:
+        return _checked_view
+
+    class checked_view(np.ndarray):
+        def __array_finalize__(self, obj):
+            self._cppyy_check = getattr(obj, '_cppyy_check', None)
+
+        def _check(self):
+            if self._cppyy_check is not None:
+                self._cppyy_check()
+
+        def __getitem__(self, idx):
+            self._check()
+            return np.ndarray.__getitem__(self, idx)
+
+        def __setitem__(self, idx, val):
+            self._check()
+            return np.ndarray.__setitem__(self, idx, val)
+
+        def __iter__(self):
+            self._check()
+            return np.ndarray.__iter__(self)
+
+        def __repr__(self):
+            self._check()
+            return np.ndarray.__repr__(self)
+
+        def __str__(self):
+            self._check()
+            return np.ndarray.__str__(self)
+
+        def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+            for arg in inputs+kwargs.get('out', ()):
+                if isinstance(arg, checked_view):
+                    arg._check()
+            inputs = tuple(isinstance(i, checked_view) and i.view(np.ndarray) or i for i in inputs)
+            if 'out' in kwargs:
+                kwargs['out'] = tuple(isinstance(o, checked_view) and o.view(np.ndarray) or o\
+                                      for o in kwargs['out'])
+            return getattr(ufunc, method)(*inputs, **kwargs)
+
+    _checked_view = checked_view
+    return _checked_view
+
+def as_numpy(container, copy=False, check_realloc=False):
+    """Returns a NumPy array viewing (no copy) the data of an STL vector, array,
+    or deque of arithmetic type, which keeps the container alive. Nested
+    containers yield a (ragged) list of views. If <check_realloc>, using the
+    view after the container has moved its data raises a RuntimeError."""
+    import numpy as np
+    return _as_numpy(np, container, copy, check_realloc, container)
+
+def _as_numpy(np, container, copy, check_realloc, owner):
+    from cppyy._cpython_cppyy import _value_type, _buffer_typecodes
+
+    value_type = _value_type(type(container))
+    if value_type is None:
+        raise TypeError('%s is not an STL container' % type(container).__name__)
+
+    size = len(container)
+    for nested in ('std::vector<', 'std::array<', 'std::deque<'):
+        if value_type.startswith(nested):
+            return [_as_numpy(np, container[i], copy, check_realloc, (owner, container))\
+                    for i in range(size)]
+
+    try:
+        dtype = np.dtype(_buffer_typecodes[value_type])
+    except KeyError:
+        raise TypeError('no NumPy equivalent for value type %s' % value_type)
+    if type(container).__cpp_name__.startswith('std::vector<bool'):
+        raise TypeError('std::vector<bool> has no addressable elements')
+
+    if not size:
+        return np.empty((0,), dtype=dtype)
+
+    internal = getattr(cppyy.gbl, '__cppyy_internal')
+    if not internal.cppyy_is_contiguous(container):
+        if not copy:
+            raise ValueError('data of %s is not contiguous; use copy=True' % type(container).__cpp_name__)
+        return np.array([container[i] for i in range(size)], dtype=dtype)
+
+    address = internal.cppyy_element_address(container, 0)
+    view = np.asarray(_ArrayView(owner, address, size, dtype))
+    if copy:
+        return view.copy()
+
+    if check_realloc:
+        def check(container=container, address=address, size=size):
+            if len(container) < size or internal.cppyy_element_address(container, 0) != address:
+                raise RuntimeError('%s has reallocated its data since the view was created'\
+                                   % type(container).__cpp_name__)
+        view = view.view(_get_checked_view(np))
+        view._cppyy_check = check
+
+    return view
+
+
 # signals as exceptions
 if not ispypy:
     FatalError            = cppyy._backend.FatalError
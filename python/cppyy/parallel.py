@@ -0,0 +1,144 @@
+""" Parallel map/reduce over random-access STL containers, using native threads.
+
+The C++ callable is given by name (or as a bound C++ function), or as C++
+source of a callable expression, e.g. a lambda. For each combination of
+callable and container type, a driver is JIT-ed that splits the container
+into contiguous ranges and processes each range on its own thread. The
+drivers release the GIL, so other Python threads can run in the meantime.
+
+The callable must not call back into Python: the worker threads do not hold
+the GIL, so e.g. a std::function or function pointer made from a Python
+callable will crash the process.
+"""
+
+import cppyy
+import itertools
+
+__all__ = [
+    'map',
+    'reduce',
+    ]
+
+
+# threading support: run fn(thread, begin, end) over [0, n) on nthreads threads,
+# rethrowing the first exception (if any) on the calling thread
+cppyy.cppdef("""#include <exception>
+#include <mutex>
+#include <thread>
+#include <type_traits>
+#include <utility>
+#include <vector>
+namespace __cppyy_internal {
+    template<typename F>
+    void parallel_ranges(size_t n, size_t nthreads, F fn) {
+        if (nthreads == 0) nthreads = std::thread::hardware_concurrency();
+        if (nthreads == 0) nthreads = 1;
+        if (nthreads > n)  nthreads = n ? n : 1;
+
+        std::exception_ptr error;
+        std::mutex error_lock;
+        auto run = [&](size_t i) {
+            try {
+                fn(i, n*i/nthreads, n*(i+1)/nthreads);
+            } catch (...) {
+                std::lock_guard<std::mutex> guard(error_lock);
+                if (!error) error = std::current_exception();
+            }
+        };
+
+        std::vector<std::thread> workers;
+        for (size_t i = 1; i < nthreads; ++i)
+            workers.emplace_back(run, i);
+        run(0);
+        for (auto& w : workers) w.join();
+        if (error) std::rethrow_exception(error);
+    }
+}""")
+
+_drivers = dict()
+_unique  = itertools.count()
+
+def _callable_source(func):
+    if type(func) is str:
+        return func
+    try:
+        return func.__cpp_name__
+    except AttributeError:
+        raise TypeError('expected a C++ callable or the C++ source of one, not %s' % type(func).__name__)
+
+def _driver(kind, func, container):
+    try:
+        cpp_type = type(container).__cpp_name__
+    except AttributeError:
+        raise TypeError('expected a C++ container, not %s' % type(container).__name__)
+    src = _callable_source(func)
+
+    key = (kind, src, cpp_type)
+    try:
+        return _drivers[key]
+    except KeyError:
+        pass
+
+  # the callable is wrapped in a generic lambda, so that function names, overload
+  # sets, function objects, and lambdas are all treated the same
+    name = 'parallel_%s%d' % (kind, next(_unique))
+    wrapped = '[](auto&&... args) -> decltype(auto) { return (%s)(std::forward<decltype(args)>(args)...); }' % src
+    if kind == 'map':
+        body = """
+    auto {name}(const {cpp_type}& c, size_t nthreads) {{
+        auto f = {wrapped};
+        using R = std::decay_t<decltype(f(c[0]))>;
+      // no vector<bool>, as its elements can not be written concurrently
+        std::vector<std::conditional_t<std::is_same<R, bool>::value, char, R>> out(c.size());
+        parallel_ranges(c.size(), nthreads, [&](size_t, size_t b, size_t e) {{
+            for (size_t i = b; i < e; ++i) out[i] = f(c[i]);
+        }});
+        return out;
+    }}"""
+    else:
+        body = """
+    {cpp_type}::value_type {name}(const {cpp_type}& c, {cpp_type}::value_type init, size_t nthreads) {{
+        using T = {cpp_type}::value_type;
+        auto f = {wrapped};
+        if (nthreads == 0) nthreads = std::thread::hardware_concurrency();
+        std::vector<T> partial(nthreads ? nthreads : 1, init);
+        std::vector<char> used(partial.size(), 0);    // not vector<bool>: written concurrently
+        parallel_ranges(c.size(), partial.size(), [&](size_t t, size_t b, size_t e) {{
+            if (b == e) return;
+            T acc = c[b];
+            for (size_t i = b+1; i < e; ++i) acc = f(acc, c[i]);
+            partial[t] = acc; used[t] = 1;
+        }});
+        T result = init;
+        for (size_t t = 0; t < partial.size(); ++t) {{
+            if (used[t]) result = f(result, partial[t]);
+        }}
+        return result;
+    }}"""
+    body = body.format(name=name, cpp_type=cpp_type, wrapped=wrapped)
+    cppyy.cppdef('namespace __cppyy_internal {%s\n}' % body)
+
+    driver = getattr(cppyy.gbl.__cppyy_internal, name)
+    driver.__release_gil__ = True
+    _drivers[key] = driver
+    return driver
+
+def map(func, container, nthreads=0, numpy=False):
+    """Returns a std::vector with <func> applied to each element of the random-
+    access <container>, computed in parallel on <nthreads> native threads (all
+    hardware threads by default), without holding the GIL (so <func> must not
+    call into Python). With <numpy>, the result is returned as a NumPy array
+    viewing the vector's data."""
+    res = _driver('map', func, container)(container, nthreads)
+    if numpy:
+        from cppyy.ll import as_numpy
+        return as_numpy(res)
+    return res
+
+def reduce(func, container, init, nthreads=0):
+    """Returns the reduction with the associative binary <func> of the elements
+    of the random-access <container>, starting from <init>, computed in parallel
+    on <nthreads> native threads (all hardware threads by default), without
+    holding the GIL (so <func> must not call into Python). Each thread reduces
+    a contiguous range, the results of which are combined in order."""
+    return _driver('reduce', func, container)(container, init, nthreads)
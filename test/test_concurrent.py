@@ -301,3 +301,126 @@ class TestCONCURRENT:
         assert State.c1 == 1000
         assert State.c2 == State.c3
 
+
+    def test08_include_async(self):
+        """Parse headers on the background interpreter thread"""
+
+        import cppyy, shutil, tempfile
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            header = os.path.join(tmpdir, 'include_async.h')
+            with open(header, 'w') as f:
+                f.write("""\
+                namespace IncludeAsync {
+                    double calc(double d) { return d*42.; }
+                }
+                namespace IncludeAsyncExisting {
+                    int calc(int i) { return i*13; }
+                }""")
+
+          # a namespace that is already bound in Python before the parse
+            cppyy.cppdef("namespace IncludeAsyncExisting { int dummy = 0; }")
+            assert cppyy.gbl.IncludeAsyncExisting.dummy == 0
+            with raises(AttributeError) as exc:
+                cppyy.gbl.IncludeAsyncExisting.does_not_exist
+            err = str(exc.value)
+
+            future = cppyy.include_async(header)
+
+          # lookups, also in existing namespaces, wait for the header to be loaded
+            assert cppyy.gbl.IncludeAsyncExisting.calc(2) == 26
+            assert cppyy.gbl.IncludeAsync.calc(2.) == 84.
+            assert future.result() == True
+
+          # with nothing pending, failed lookups keep the backend's error
+            with raises(AttributeError) as exc:
+                cppyy.gbl.IncludeAsyncExisting.does_not_exist
+            assert str(exc.value) == err
+
+          # only parsing on the interpreter thread runs without the GIL
+            assert not cppyy.gbl.gInterpreter.Declare.__release_gil__
+
+            future = cppyy.include_async(os.path.join(tmpdir, 'doesnotexist.h'))
+            assert isinstance(future.exception(), ImportError)
+            with raises(AttributeError):
+                cppyy.gbl.IncludeAsyncDoesNotExist
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test09_parallel_map_reduce(self):
+        """Parallel map/reduce over STL containers on native threads"""
+
+        import cppyy, cppyy.parallel
+        import threading, time
+
+        N = 100000
+        v = cppyy.gbl.std.vector['double'](range(N))
+
+        res = cppyy.parallel.map(cppyy.gbl.Workers.calc, v, nthreads=4)
+        assert len(res) == N
+        assert res[0] == 0. and res[N-1] == (N-1)*42.
+
+        res = cppyy.parallel.map('[](double d) { return int(d < 10.); }', v)
+        assert sum(res) == 10
+
+        total = cppyy.parallel.reduce('std::plus<double>()', v, 0., nthreads=4)
+        assert total == N*(N-1)/2.
+        assert cppyy.parallel.reduce('std::plus<double>()', v, 1., nthreads=N+3) == N*(N-1)/2.+1
+        assert cppyy.parallel.reduce('std::plus<double>()', cppyy.gbl.std.vector['double'](), 3.) == 3.
+
+      # the GIL is released while the threads run: the C++ callable waits for a
+      # Python thread to respond, which times out if the GIL is held
+        cppyy.cppdef("""\
+        #include <atomic>
+        #include <chrono>
+        namespace Workers {
+            std::atomic<int> gil_waiting{0}, gil_flag{0};
+            bool is_waiting() { return gil_waiting.load(); }
+            void set_gil_flag() { gil_flag = 1; }
+            int wait_gil_flag(double) {
+                gil_waiting = 1;
+                for (int i = 0; i < 10000 && !gil_flag; ++i)
+                    std::this_thread::sleep_for(std::chrono::milliseconds(1));
+                return gil_flag.load();
+            }
+        }""")
+        def respond(Workers=cppyy.gbl.Workers):
+            for i in range(10000):
+                if Workers.is_waiting():
+                    Workers.set_gil_flag()
+                    break
+                time.sleep(0.001)
+        t = threading.Thread(target=respond)
+        t.start()
+        res = cppyy.parallel.map(cppyy.gbl.Workers.wait_gil_flag,
+                                 cppyy.gbl.std.vector['double']([0.]), nthreads=1)
+        t.join()
+        assert list(res) == [1]
+
+        results = []
+        def run():
+            results.append(cppyy.parallel.reduce('std::plus<double>()', v, 0.))
+        threads = [threading.Thread(target=run) for i in range(4)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        assert results == [N*(N-1)/2.]*4
+
+      # exceptions from the worker threads propagate
+        cppyy.cppdef("""\
+        namespace Workers {
+            double fail(double d) { if (d > 10.) throw std::runtime_error("too large"); return d; }
+        }""")
+        with raises(Exception):
+            cppyy.parallel.map(cppyy.gbl.Workers.fail, v)
+
+        with raises(TypeError):
+            cppyy.parallel.map(42, v)
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        a = cppyy.parallel.map('[](double d) { return 2*d; }', v, numpy=True)
+        assert a.dtype == np.float64 and a[N-1] == 2.*(N-1)
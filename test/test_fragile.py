@@ -612,6 +612,301 @@ class TestFRAGILE:
         cppyy.cppdef('#define SOME_INT 42')
         assert cppyy.macro("SOME_INT") == 42
 
+    def test27_jit_cache(self):
+        """On-disk caching of cppdef results"""
+
+        import cppyy, shutil, subprocess, tempfile
+
+        cachedir, incdir = tempfile.mkdtemp(), tempfile.mkdtemp()
+        cppyy.set_jit_cache(cachedir)
+        try:
+            src = "namespace jit_cache { int forty_two() { return 42; } int answer = 42;"\
+                  " template<typename T> T twice(T t) { return 2*t; } }"
+            cppyy.cppdef(src)
+            assert cppyy.gbl.jit_cache.forty_two() == 42
+
+            cppyy._jitcache.wait()       # entries are built in the background
+            stats = cppyy.jit_cache_stats()
+            assert stats['misses'] == 1
+            assert stats['hits']   == 0
+            assert stats['entries'] == 1
+            assert stats['failed']  == 0
+            assert 0 < stats['bytes']
+
+          # a fresh process should pick up the compiled result, with all names
+          # available right away, and source that depends on it should still
+          # compile; the latter fragment fails to build on its own, which is
+          # recorded so that it is not rebuilt on the next run
+            dep = "namespace jit_cache { int forty_three() { return forty_two() + 1; } }"
+            code = "import cppyy; cppyy.set_jit_cache(%r); cppyy.cppdef(%r);"\
+                   "assert cppyy.gbl.jit_cache.forty_two() == 42;"\
+                   "assert cppyy.gbl.jit_cache.answer == 42;"\
+                   "assert cppyy.gbl.jit_cache.twice[int](21) == 42;"\
+                   "assert cppyy.jit_cache_stats()['hits'] == 1;"\
+                   "cppyy.cppdef(%r); assert cppyy.gbl.jit_cache.forty_three() == 43;"\
+                   "assert cppyy.jit_cache_stats()['pending'] == %d;"\
+                   "cppyy.set_jit_cache(None)"
+            assert subprocess.call([sys.executable, '-c', code % (cachedir, src, dep, 1)]) == 0
+            assert cppyy.jit_cache_stats()['failed'] == 1
+            assert subprocess.call([sys.executable, '-c', code % (cachedir, src, dep, 0)]) == 0
+
+          # edits of (nested) included headers invalidate the entry
+            with open(os.path.join(incdir, 'jit_cache_header.h'), 'w') as f:
+                f.write('#include "jit_cache_nested.h"\n')
+            nested = os.path.join(incdir, 'jit_cache_nested.h')
+            with open(nested, 'w') as f:
+                f.write('int jit_cache_nested() { return 1; }\n')
+            cppyy.add_include_path(incdir)
+
+            inc = '#include "jit_cache_header.h"'
+            key = cppyy._jitcache._cache.key('include', inc)
+            with open(nested, 'w') as f:
+                f.write('int jit_cache_nested() { return 42; }\n')
+            assert cppyy._jitcache._cache.key('include', inc) != key
+
+          # source that tests macros from earlier source is not cached, as it is
+          # built on its own, i.e. without those macros
+            stats = cppyy.jit_cache_stats()
+            entries = stats['entries'] + stats['failed']
+            cppyy.cppdef("#define JIT_CACHE_FAST 1")
+            cppyy.cppdef("""\
+            namespace jit_cache {
+            #ifdef JIT_CACHE_FAST
+                int fast() { return 1; }
+            #else
+                int fast() { return 0; }
+            #endif
+            }""")
+            assert cppyy.gbl.jit_cache.fast() == 1
+            cppyy._jitcache.wait()
+            stats = cppyy.jit_cache_stats()
+            assert stats['entries'] + stats['failed'] == entries+1    # the #define only
+
+          # eviction down to the requested size
+            cppyy.set_jit_cache(cachedir, max_bytes=0)
+            assert cppyy.jit_cache_stats()['entries'] == 0
+        finally:
+            cppyy.set_jit_cache(None)
+            shutil.rmtree(cachedir, ignore_errors=True)
+            shutil.rmtree(incdir, ignore_errors=True)
+
+        assert cppyy.jit_cache_stats() is None
+
+    def test28_cppdef_many(self):
+        """Declaration of many code fragments in one transaction"""
+
+        import cppyy
+
+        assert cppyy.cppdef_many(
+            ["namespace cppdef_many { int f0() { return 0; } }",
+             "namespace cppdef_many { int f1() { return f0() + 1; } }",
+             "namespace cppdef_many { int f2() { return f1() + 1; } }"])
+        assert cppyy.gbl.cppdef_many.f2() == 2
+
+        with raises(SyntaxError) as exc:
+            cppyy.cppdef_many(
+                ["namespace cppdef_many { int g0() { return 0; } }",
+                 "namespace cppdef_many { int g1() { return 1aap; } }",
+                 "namespace cppdef_many { int g2() { return 2; } }"])
+        assert "fragment(s) 1" in str(exc.value)
+
+      # notes that point to other fragments do not count
+        with raises(SyntaxError) as exc:
+            cppyy.cppdef_many(
+                ["namespace cppdef_many { int h0() { return 0; } }",
+                 "namespace cppdef_many { int h0() { return 1; } }"])
+        assert "fragment(s) 1" in str(exc.value)
+        assert not "fragment(s) 0" in str(exc.value)
+
+    def test29_cppdef_lazy(self):
+        """Deferred declaration of C++ code until first use"""
+
+        import cppyy
+
+        assert cppyy.cppdef_lazy("""\
+        namespace cppdef_lazy {
+            int f() { return 42; }
+        }
+        int cppdef_lazy_g() { return cppdef_lazy::f() + 1; }""",
+            provides=['cppdef_lazy::f', 'cppdef_lazy_g'])
+
+      # broken code is fine, as long as it is never used
+        assert cppyy.cppdef_lazy("int cppdef_lazy_broken() { return 1aap; }",
+            provides=['cppdef_lazy_broken'])
+
+        assert cppyy.gbl.cppdef_lazy_g() == 43
+        assert cppyy.gbl.cppdef_lazy.f() == 42
+
+        with raises(SyntaxError):
+            cppyy.gbl.cppdef_lazy_broken
+
+        with raises(AttributeError):
+            cppyy.gbl.cppdef_lazy_does_not_exist
+
+      # failed lookups in scopes with lazy names keep the backend's error
+        cppyy.cppdef("namespace cppdef_lazy_errors { int i = 0; }")
+        ns = cppyy.gbl.cppdef_lazy_errors
+        with raises(AttributeError) as exc:
+            ns.does_not_exist
+        err = str(exc.value)
+
+        cppyy.cppdef_lazy("namespace cppdef_lazy_errors { int j = 1; }",
+            provides=['cppdef_lazy_errors::j'])
+        with raises(AttributeError) as exc:
+            ns.does_not_exist
+        assert str(exc.value) == err
+        assert ns.j == 1
+
+    def test30_startup_profile(self):
+        """Phase timings of 'import cppyy'"""
+
+        import json, os, subprocess, tempfile
+
+        fd, fname = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            env = dict(os.environ, CPPYY_PROFILE_STARTUP=fname)
+            assert subprocess.call([sys.executable, '-c', 'import cppyy'], env=env) == 0
+            with open(fname) as f:
+                phases = json.load(f)
+        finally:
+            os.remove(fname)
+
+        names = [p['phase'] for p in phases]
+        assert names[0] == 'total'
+        for name in ['backend', 'autoloading', 'typemap', 'pythonizations', 'include_paths']:
+            assert name in names
+        total = phases[0]['time']
+        assert 0 < total
+        assert sum(p['time'] for p in phases if not '.' in p['phase'] and p['phase'] != 'total') <= total
+
+    def test31_api_path_cache(self):
+        """Memoization of the CPyCppyy API include path"""
+
+        if ispypy or 'CPPYY_API_PATH' in os.environ:
+            skip('API path is not searched for')
+
+        if sys.hexversion < 0x3080000:
+            skip('importlib.metadata is not available')
+
+        import json, shutil, subprocess, tempfile
+
+        cachedir = tempfile.mkdtemp()
+        try:
+            env = dict(os.environ, XDG_CACHE_HOME=cachedir)
+            for i in range(2):       # first run fills, second run uses the cache
+                assert subprocess.call([sys.executable, '-c',
+                    'import cppyy; cppyy.include("CPyCppyy/API.h")'], env=env) == 0
+
+            with open(os.path.join(cachedir, 'cppyy', 'apipath.json')) as f:
+                cached = json.load(f)
+            assert os.path.exists(os.path.join(cached['path'], 'CPyCppyy', 'API.h'))
+        finally:
+            shutil.rmtree(cachedir, ignore_errors=True)
+
+      # no helper variables are left behind in the module
+        import cppyy
+        for name in ('f', 'fp', 'cached', 'record', 'apipath_cache', '_apipath_from_metadata'):
+            assert not hasattr(cppyy, name)
+
+    def test32_warm(self):
+        """Up-front resolution of proxies for sharing with forked workers"""
+
+        import cppyy
+
+        cppyy.cppdef("""\
+        namespace warm_ns {
+            struct Warm { int m_int = 42; int get_int() { return m_int; } };
+            int func() { return 13; }
+        }""")
+
+        resolved = cppyy.warm(['warm_ns::Warm', 'warm_ns::func', 'std::vector<warm_ns::Warm>'])
+        assert resolved['warm_ns::Warm'] is cppyy.gbl.warm_ns.Warm
+        assert resolved['warm_ns::func']() == 13
+        assert resolved['std::vector<warm_ns::Warm>'] is cppyy.gbl.std.vector[cppyy.gbl.warm_ns.Warm]
+        assert 'get_int' in cppyy.gbl.warm_ns.Warm.__dict__
+
+        with raises(AttributeError):
+            cppyy.warm(['warm_ns::DoesNotExist'])
+
+        if not 'linux' in sys.platform:
+            return
+
+      # in a forked child, touching warmed classes adds fewer private pages than
+      # touching the same number of classes that were not warmed
+        nclasses, nmethods = 50, 20
+        for ns in ('warm_hot', 'warm_cold'):
+            cppyy.cppdef('namespace %s { %s }' % (ns, ' '.join(
+                ['struct S%d { %s };' % (i, ' '.join(
+                    ['int m%d() { return %d; }' % (j, j) for j in range(nmethods)]))
+                 for i in range(nclasses)])))
+
+        def touch(ns):
+            for i in range(nclasses):
+                klass = getattr(ns, 'S%d' % i)
+                for j in range(nmethods):
+                    getattr(klass, 'm%d' % j)
+
+        import gc
+        cppyy.warm(['warm_hot::S%d' % i for i in range(nclasses)], freeze=True)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                p0 = cppyy.shared_pages()['private']
+                touch(cppyy.gbl.warm_hot)
+                p1 = cppyy.shared_pages()['private']
+                touch(cppyy.gbl.warm_cold)
+                p2 = cppyy.shared_pages()['private']
+                os._exit(not (p1 - p0 < p2 - p1 and cppyy.gbl.warm_ns.Warm().get_int() == 42))
+            assert os.waitpid(pid, 0)[1] == 0
+        finally:
+            gc.unfreeze()
+
+    def test33_sizeof_many(self):
+        """Sizes of types from reflection, singly and in bulk"""
+
+        import cppyy, ctypes, gc, weakref
+
+        cppyy.cppdef("""\
+        namespace sizeof_many {
+            struct S1 { int a; };
+            struct S2 { double d[4]; };
+            template<typename T> struct S3 { T t[3]; };
+        }""")
+
+        ns = cppyy.gbl.sizeof_many
+
+        assert cppyy.sizeof(ns.S1) == ctypes.sizeof(ctypes.c_int)
+        assert cppyy.sizeof('sizeof_many::S2') == 4*ctypes.sizeof(ctypes.c_double)
+        assert cppyy.sizeof(ns.S2()) == cppyy.sizeof(ns.S2)
+        assert cppyy.sizeof('int') == ctypes.sizeof(ctypes.c_int)
+
+        sizes = cppyy.sizeof_many([ns.S1, 'sizeof_many::S2', 'sizeof_many::S3<short>',
+                                   'double', ctypes.c_int64, 'sizeof_many::S1*'])
+        assert sizes == [ctypes.sizeof(ctypes.c_int), 4*ctypes.sizeof(ctypes.c_double),
+                         3*ctypes.sizeof(ctypes.c_short), ctypes.sizeof(ctypes.c_double),
+                         8, ctypes.sizeof(ctypes.c_void_p)]
+
+      # the cache does not keep classes alive
+        class Local(ctypes.Structure):
+            _fields_ = [('a', ctypes.c_int), ('b', ctypes.c_int)]
+        assert cppyy.sizeof(Local) == 2*ctypes.sizeof(ctypes.c_int)
+        ref = weakref.ref(Local)
+        del Local
+        gc.collect()
+        assert ref() is None
+
+      # the reflected size of incomplete (or unknown) types is not trusted
+        cppyy.cppdef("namespace sizeof_many { struct Fwd; }")
+        assert cppyy._reflected_size('sizeof_many::Fwd') == 0
+        assert cppyy._reflected_size('sizeof_many::DoesNotExist') == 0
+        with raises(SyntaxError):
+            cppyy.sizeof_many(['sizeof_many::Fwd'])
+
+        cppyy.cppdef("namespace sizeof_many { struct Fwd { double d[2]; }; }")
+        assert cppyy.sizeof('sizeof_many::Fwd') == 2*ctypes.sizeof(ctypes.c_double)
+        assert cppyy.sizeof_many(['sizeof_many::Fwd']) == [2*ctypes.sizeof(ctypes.c_double)]
+
 
 class TestSIGNALS:
     def setup_class(cls):
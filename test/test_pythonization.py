@@ -257,6 +257,305 @@ class TestClassPYTHONIZATION:
 
         assert cppyy.gbl.pyzables.WithCallback2.klass_name == 'pyzables::WithCallback3'
 
+    def test10_bytes_policy(self):
+        """Return std::string results as bytes, without decoding"""
+
+        import cppyy
+
+        cppyy.py.add_pythonization(
+            cppyy.py.set_bytes_policy('BytesPolicy$', 'get_blob'), 'pyzables')
+
+        cppyy.cppdef(r"""\
+        namespace pyzables {
+        class BytesPolicy {
+        public:
+            std::string get_blob() { return std::string("\xff\x00\x80", 3); }
+            std::string& get_blob_ref() { return fBlob; }
+            std::string get_blob_n(int n) { return std::string(n, '\xff'); }
+            std::string get_text() { return "text"; }
+            std::string get_blob_text_n(int n) { return std::string(n, 'x'); }
+            std::string fBlob = std::string("\xfe\x00", 2);
+        }; }""")
+
+        b = cppyy.gbl.pyzables.BytesPolicy()
+        assert b.get_blob() == b'\xff\x00\x80'
+        assert type(b.get_blob()) is bytes
+        assert b.get_blob_ref() == b'\xfe\x00'    # by reference
+        assert type(b.get_blob_ref()) is bytes
+        assert b.get_blob_n(2) == b'\xff\xff'
+        assert b.get_blob_n(n=2) == b'\xff\xff'   # keywords go through the method
+        assert b.get_blob_text_n(n=2) == b'xx'
+        assert b.get_text() == 'text'              # not matched: unchanged
+
+    def test11_container_policy(self):
+        """Convert STL container results to Python builtins on return"""
+
+        import cppyy
+
+        cppyy.py.add_pythonization(
+            cppyy.py.set_container_policy('ContainerPolicy$', 'get_'), 'pyzables')
+
+        cppyy.cppdef("""\
+        namespace pyzables {
+        struct Dummy {};
+        class ContainerPolicy {
+        public:
+            std::vector<double> get_vector() { return {1., 2., 3.}; }
+            std::map<std::string, int> get_map() { return {{"a", 1}, {"b", 2}}; }
+            std::vector<std::string> get_strings() { return {"a", "b"}; }
+            std::vector<std::vector<int>> get_nested() { return {{1}, {2, 3}}; }
+            std::tuple<int, double> get_tuple() { return std::make_tuple(1, 2.); }
+            std::vector<Dummy> get_objects() { return {Dummy{}}; }
+            std::vector<double> vector() { return {1., 2., 3.}; }
+        }; }""")
+
+        c = cppyy.gbl.pyzables.ContainerPolicy()
+        assert c.get_vector() == [1., 2., 3.]
+        assert type(c.get_vector()) is list
+        assert c.get_map() == {'a' : 1, 'b' : 2}
+        assert c.get_strings() == ['a', 'b']
+        assert c.get_nested() == [[1], [2, 3]]
+        assert c.get_tuple() == (1, 2.)
+        assert type(c.get_objects()) is not list      # proxies: unchanged
+        assert type(c.vector()) is not list           # not matched
+
+        with raises(ValueError):
+            cppyy.py.set_container_policy('ContainerPolicy$', 'get_', convert='pandas')
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        cppyy.py.add_pythonization(
+            cppyy.py.set_container_policy('ContainerPolicy2$', 'get_', convert='numpy'), 'pyzables')
+        cppyy.cppdef("""\
+        namespace pyzables {
+        class ContainerPolicy2 {
+        public:
+            std::vector<double> get_vector() { return {1., 2., 3.}; }
+        }; }""")
+
+        a = cppyy.gbl.pyzables.ContainerPolicy2().get_vector()
+        assert type(a) is np.ndarray
+        assert list(a) == [1., 2., 3.]
+
+    def test12_pythonization_registry(self):
+        """Indexed dispatch to, and timing of, pythonizors"""
+
+        import cppyy
+
+        seen = []
+        def pythonizor(klass, name):
+            seen.append(name)
+
+        exact = cppyy.py.set_gil_policy('Registry1$', 'calc$')
+        pattern = cppyy.py.set_gil_policy('Registry[23]$', 'calc')
+        for p in (pythonizor, exact, pattern):
+            cppyy.py.add_pythonization(p, 'pyzables')
+
+        cppyy.cppdef("""\
+        namespace pyzables {
+            struct Registry1 { double calc(double d) { return 2*d; } };
+            struct Registry2 { double calc(double d) { return 3*d; } double calc2(double d) { return d; } };
+            struct Registry4 { double calc(double d) { return 4*d; } };
+        }""")
+
+        ns = cppyy.gbl.pyzables
+        for name in ('Registry1', 'Registry2', 'Registry4'):
+            getattr(ns, name)
+        assert set(['Registry1', 'Registry2', 'Registry4']).issubset(set(seen))
+
+        assert ns.Registry1.calc.__release_gil__
+        assert ns.Registry2.calc.__release_gil__
+        assert ns.Registry2.calc2.__release_gil__
+        assert not ns.Registry4.calc.__release_gil__
+
+        stats = dict((id(st['pythonizor']), st) for st in cppyy.py.pythonization_stats())
+        assert stats[id(exact)]['calls']   == 1         # only for matching classes
+        assert stats[id(pattern)]['calls'] == 1
+        assert stats[id(pythonizor)]['calls'] >= 3      # plain callables: always
+        assert stats[id(pythonizor)]['time'] >= 0.
+        assert stats[id(exact)]['scope'] == 'pyzables'
+
+        for p in (pythonizor, exact, pattern):
+            assert cppyy.py.remove_pythonization(p, 'pyzables') == True
+        assert cppyy.py.remove_pythonization(exact, 'pyzables') == False
+
+      # back references keep their meaning next to other patterns with groups
+        other = cppyy.py.set_gil_policy('(Reg)istry$', 'calc')
+        backref = cppyy.py.set_gil_policy(r'Repeat(\d)\1$', 'calc')
+        for p in (other, backref):
+            cppyy.py.add_pythonization(p, 'pyzables')
+
+        cppyy.cppdef("""\
+        namespace pyzables {
+            struct Repeat33 { double calc(double d) { return 3*d; } };
+            struct Repeat34 { double calc(double d) { return 3*d; } };
+        }""")
+
+        assert ns.Repeat33.calc.__release_gil__
+        assert not ns.Repeat34.calc.__release_gil__
+
+        for p in (other, backref):
+            assert cppyy.py.remove_pythonization(p, 'pyzables') == True
+
+    def test13_lazy_pythonization(self):
+        """Deferral of pythonizors until first member access"""
+
+        import cppyy
+
+        lazy = cppyy.py.set_gil_policy('Lazy1$', 'calc$')
+        cppyy.py.add_pythonization(lazy, 'pyzables', lazy=True)
+
+        cppyy.cppdef("""\
+        namespace pyzables {
+            struct Lazy1 { double calc(double d) { return 2*d; } int other() { return 42; } };
+        }""")
+
+        Lazy1 = cppyy.gbl.pyzables.Lazy1
+
+        stats = dict((id(st['pythonizor']), st) for st in cppyy.py.pythonization_stats())
+        assert stats[id(lazy)]['calls'] == 0          # bound, but nothing applied yet
+
+        assert Lazy1().other() == 42                  # untargeted member: still deferred
+        stats = dict((id(st['pythonizor']), st) for st in cppyy.py.pythonization_stats())
+        assert stats[id(lazy)]['calls'] == 0
+
+        assert Lazy1().calc(3.) == 6.                 # first access applies the pythonizor
+        assert Lazy1.calc.__release_gil__
+        stats = dict((id(st['pythonizor']), st) for st in cppyy.py.pythonization_stats())
+        assert stats[id(lazy)]['calls'] == 1
+
+        assert Lazy1().calc(4.) == 8.
+        assert cppyy.py.remove_pythonization(lazy, 'pyzables')
+
+    def test14_native_properties(self):
+        """Properties from make_property call C++ accessors directly"""
+
+        import cppyy
+
+        cppyy.py.add_pythonization(
+            cppyy.py.make_property('Props1$', 'get_(\\w+)$', 'set_(\\w+)$'), 'pyzables')
+        cppyy.py.add_pythonization(
+            cppyy.py.make_property('Props2$', 'get_value$', 'set_value$', prop_name='value'), 'pyzables')
+
+        cppyy.cppdef("""\
+        namespace pyzables {
+            class Props1 {
+            public:
+                int get_x() const { return fX; }
+                void set_x(int x) { fX = x; }
+                double get_y() const { return fY; }
+                double get_y(int scale) const { return scale*fY; }
+                void set_y(double y) { fY = y; }
+            private:
+                int fX = 1;
+                double fY = 2.;
+            };
+
+            struct Props2 {
+                int get_value() { return fValue; }
+                void set_value(int v) { fValue = 2*v; }
+                int fValue = 3;
+            };
+        }""")
+
+        ns = cppyy.gbl.pyzables
+
+        p = ns.Props1()
+        assert p.x == 1
+        p.x = 42
+        assert p.x == 42 and p.get_x() == 42
+        assert p.y == 2.                              # overloaded getter: no-args one
+        p.y = 3.5
+        assert p.y == 3.5 and p.get_y(2) == 7.
+
+      # the accessors are the C++ methods themselves, not Python wrappers
+        assert hasattr(ns.Props1.x.fget, '__overload__')
+        assert hasattr(ns.Props1.x.fset, '__overload__')
+
+        p = ns.Props2()
+        assert p.value == 3
+        p.value = 5
+        assert p.value == 10
+
+      # overrides of the accessors in Python-derived classes are honored
+        class Props2Derived(ns.Props2):
+            def get_value(self):
+                return super(Props2Derived, self).get_value() + 1
+
+        p = Props2Derived()
+        assert p.value == 4
+        p.value = 5
+        assert p.value == 11
+
+        class Props2Plain(ns.Props2):
+            pass
+
+        assert not 'value' in Props2Plain.__dict__        # nothing overridden
+        assert Props2Plain().value == 3
+
+    def test15_native_composition(self):
+        """Composition of methods with C++ post-processing"""
+
+        import cppyy, ctypes
+
+        cppyy.cppdef("""\
+        namespace pyzables {
+            struct Compose1 {
+                int get() { return 21; }
+                int add(int a, int b) { return a+b; }
+            };
+            struct Compose2 {
+                double value(double d) { return d; }
+            };
+            struct Compose3 {
+                int fill(int& out) { out = 42; return 1; }
+                int call(int (*f)(int), int i) { return f(i); }
+                std::string name() { return "name"; }
+            };
+            int twice(const Compose1&, int i) { return 2*i; }
+            int twice3(const Compose3&, int i) { return 2*i; }
+            int square(int i) { return i*i; }
+        }""")
+
+        ns = cppyy.gbl.pyzables
+
+        cppyy.py.add_pythonization(
+            cppyy.py.compose_method('Compose1$', 'get|add', ns.twice), 'pyzables')
+        cppyy.py.add_pythonization(
+            cppyy.py.compose_method('Compose2$', 'value$', '[](const auto&, double d) { return d+1.; }'), 'pyzables')
+
+        c = ns.Compose1()
+        assert c.get() == 42
+        assert c.add(1, 2) == 6
+        assert c.get() == 42
+
+      # bound as C++ functions, not Python closures
+        assert type(ns.Compose1.__dict__['get']).__name__ != 'function'
+        assert type(ns.Compose1.__dict__['add']).__name__ != 'function'
+
+        assert ns.Compose2().value(1.5) == 2.5
+
+      # arguments are forwarded, so that out-parameters are updated
+        cppyy.py.add_pythonization(
+            cppyy.py.compose_method('Compose3$', 'fill|call', ns.twice3), 'pyzables')
+        cppyy.py.add_pythonization(
+            cppyy.py.compose_method('Compose3$', 'name', '[](const auto&, int i) { return i; }'), 'pyzables')
+
+        c, i = ns.Compose3(), ctypes.c_int(0)
+        assert c.fill(i) == 2
+        assert i.value == 42
+        assert type(ns.Compose3.__dict__['fill']).__name__ != 'function'
+
+        assert c.call(ns.square, 3) == 18
+
+      # compositions that can not be instantiated up-front fall back on Python
+        assert type(ns.Compose3.__dict__['name']).__name__ == 'function'
+        with raises(TypeError):
+            c.name()
+
 
 ## actual test run
 if __name__ == '__main__':
@@ -711,6 +711,218 @@ class TestSTLVECTOR:
         assert ns.test[0] == "hello"
         assert ns.test[1] == "world"
 
+    def test21_vector_cpp17_deduction(self):
+        """Element type deduction of C++17 style initialization"""
+
+        import cppyy
+
+        std = cppyy.gbl.std
+
+        for l, t in [((1, 2, 3),   int),
+                     ((1., 2., 3.), 'double'),
+                     ((1, 2.5, 3),  'double'),        # promotion beyond first element
+                     ((1.5, 2, 3),  'double'),
+                     ((1, 2, 3.5),  'double')]:
+            for i in range(2):                      # second time is from cache
+                v = std.vector(l)
+                assert type(v) is std.vector[t]
+                assert list(v) == list(l)
+
+        m = std.map({1 : 1, 2 : 2.5})
+        assert type(m) is std.map[int, 'double']
+        assert m[1] == 1. and m[2] == 2.5
+
+        m = std.map({1 : 2.5, 2 : 1})
+        assert type(m) is std.map[int, 'double']
+
+    def test22_vector_bulk_extend(self):
+        """Bulk insertion of buffers and iterables with extend and +="""
+
+        import cppyy, array
+
+        std = cppyy.gbl.std
+
+        v = std.vector['double']()
+        v += array.array('d', [1., 2., 3.])
+        v.extend([4, 5.])                           # ints are converted
+        v.extend(float(i) for i in range(6, 8))     # no len()
+        assert list(v) == [1., 2., 3., 4., 5., 6., 7.]
+
+        N = 200000                                  # multiple chunks
+        v = std.vector[int]()
+        v += array.array('i', range(10))
+        v.extend(range(10, N))
+        assert len(v) == N
+        assert v[0] == 0 and v[N//2] == N//2 and v[N-1] == N-1
+
+      # chars are copied from buffers in bulk, but, as with element access,
+      # their values are 1-character str
+        v = std.vector['unsigned char']()
+        v += b'\x01\x02\x03'
+        v.extend(['\x04', 5])
+        assert list(v) == ['\x01', '\x02', '\x03', '\x04', '\x05']
+        assert v.tolist() == list(v)
+        assert v.tobytes() == b'\x01\x02\x03\x04\x05'
+
+        with raises(TypeError):
+            std.vector[int]().extend(['a', 'b'])
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        v = std.vector['double']()
+        v += np.arange(N, dtype=np.float64)
+        assert len(v) == N and v[N-1] == N-1
+
+        v = std.vector[int]()
+        v += np.arange(10, dtype=np.int64)          # different size: converted
+        v += np.arange(10, 20, dtype=np.int32)
+        assert list(v) == list(range(20))
+
+    def test23_zero_copy_numpy_view(self):
+        """Zero-copy NumPy views of vector, array, and deque"""
+
+        import cppyy, gc
+        from cppyy import ll
+
+        try:
+            import numpy as np
+        except ImportError:
+            skip('numpy is not installed')
+
+        std = cppyy.gbl.std
+
+        v = std.vector['double'](range(10))
+        a = ll.as_numpy(v)
+        assert a.dtype == np.float64
+        assert list(a) == list(range(10))
+        a[0] = 42.
+        assert v[0] == 42.                   # shared data
+        v[1] = 13.
+        assert a[1] == 13.
+
+      # lifeline: the view keeps the container alive
+        del v; gc.collect()
+        assert a[0] == 42.
+
+        c = ll.as_numpy(std.vector[int](range(3)), copy=True)
+        assert list(c) == [0, 1, 2]
+
+        arr = std.array['int', 4]((1, 2, 3, 4))
+        assert list(ll.as_numpy(arr)) == [1, 2, 3, 4]
+
+        d = std.deque['float']()
+        for i in range(10): d.push_back(i)
+        assert list(ll.as_numpy(d)) == list(range(10))
+
+        assert len(ll.as_numpy(std.vector['double']())) == 0
+
+      # nested containers give ragged views
+        vv = std.vector[std.vector[int]]()
+        vv.push_back(std.vector[int]((1,)))
+        vv.push_back(std.vector[int]((2, 3)))
+        r = ll.as_numpy(vv)
+        assert len(r) == 2
+        assert list(r[0]) == [1] and list(r[1]) == [2, 3]
+
+        with raises(TypeError):
+            ll.as_numpy(std.vector['std::string']())
+
+      # optional detection of use after reallocation
+        v = std.vector[int](range(2))
+        a = ll.as_numpy(v, check_realloc=True)
+        assert a[1] == 1
+        assert (a+1)[1] == 2
+        for i in range(1000): v.push_back(i)
+        with raises(RuntimeError):
+            a[0]
+        with raises(RuntimeError):
+            a+1
+
+    def test24_vector_bulk_construction(self):
+        """Bulk construction with from_buffer and from_iterable"""
+
+        import cppyy, array
+
+        std = cppyy.gbl.std
+
+        v = std.vector['double'].from_buffer(array.array('d', [1., 2., 3.]))
+        assert type(v) is std.vector['double']
+        assert list(v) == [1., 2., 3.]
+
+        with raises(TypeError):
+            std.vector['double'].from_buffer(array.array('i', [1, 2, 3]))
+        with raises(TypeError):
+            std.vector['double'].from_buffer([1., 2., 3.])
+
+        v = std.vector[int].from_iterable([1, 2, 3])
+        assert list(v) == [1, 2, 3]
+        v = std.vector[int].from_iterable(tuple(range(100)))
+        assert list(v) == list(range(100))
+        v = std.vector['double'].from_iterable(i/2. for i in range(4))
+        assert list(v) == [0., 0.5, 1., 1.5]
+        assert len(std.vector[int].from_iterable([])) == 0
+
+        v = std.vector((1., 2., 3.))           # C++17 deduction, in bulk
+        assert type(v) is std.vector['double']
+        assert list(v) == [1., 2., 3.]
+
+        with raises(TypeError):
+            std.vector[int].from_iterable([1, 'a'])
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        v = std.vector['double'].from_buffer(np.arange(10, dtype=np.float64))
+        assert list(v) == list(range(10))
+        v = std.vector['double'].from_iterable(np.arange(10, dtype=np.float32))
+        assert list(v) == list(range(10))
+        v = std.vector['long long'].from_iterable(np.arange(10, dtype=np.int32))
+        assert list(v) == list(range(10))
+
+    def test25_vector_bulk_export(self):
+        """Bulk export with tolist, tobytes, and to_numpy"""
+
+        import cppyy, array
+
+        std = cppyy.gbl.std
+
+        v = std.vector[int](range(10))
+        l = v.tolist()
+        assert type(l) is list and l == list(range(10))
+        assert v.tobytes() == array.array('i', range(10)).tobytes()
+        assert std.vector['double']().tolist() == []
+        assert std.vector['double']().tobytes() == b''
+
+        d = std.deque['double']()
+        for i in range(5): d.push_back(i/2.)
+        assert d.tolist() == [0., 0.5, 1., 1.5, 2.]
+
+        a = std.array['unsigned char', 3]()
+        a[0], a[1], a[2] = 1, 2, 3
+        assert a.tobytes() == b'\x01\x02\x03'
+        assert a.tolist() == [a[0], a[1], a[2]] == ['\x01', '\x02', '\x03']
+
+        assert not hasattr(std.vector[bool](), 'tolist')
+        assert not hasattr(std.vector[std.string](), 'tolist')
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        a = v.to_numpy()
+        assert a.dtype == np.int32 and list(a) == list(range(10))
+        a[0] = 42
+        assert v[0] == 0                   # copy by default
+        a = v.to_numpy(copy=False)
+        a[0] = 42
+        assert v[0] == 42
+
 
 class TestSTLSTRING:
     def setup_class(cls):
@@ -1007,6 +1219,28 @@ class TestSTLSTRING:
         assert str (ns.Test3()) == "Test3"
         assert repr(ns.Test3()) == "Test3"
 
+    def test11_string_memoryview(self):
+        """Zero-copy memoryview of, and bytes from, std::string data"""
+
+        import cppyy, gc
+
+        payload = b'\x00\xff\xfe binary \x80'
+        s = cppyy.gbl.std.string(payload, len(payload))
+        assert s.tobytes() == payload
+
+        m = s.as_memoryview()
+        assert m.format == 'B' and len(m) == len(payload)
+        assert m.tobytes() == payload
+        m[1] = ord('x')                    # shared data
+        assert s.tobytes()[1:2] == b'x'
+
+        del s; gc.collect()                # view keeps the string alive
+        assert m[0] == 0 and m[2] == 0xfe
+
+        e = cppyy.gbl.std.string()
+        assert len(e.as_memoryview()) == 0
+        assert e.tobytes() == b''
+
 
 class TestSTLLIST:
     def setup_class(cls):
@@ -1301,6 +1535,57 @@ class TestSTLMAP:
             m = mtype['std::string', ns.Base]((("aap", ns.Derived()), ("noot", ns.Derived())))
             assert len(m) == 2
 
+    def test09_map_bulk_conversion(self):
+        """Bulk conversion of maps to/from dict and to arrays"""
+
+        import cppyy
+        std = cppyy.gbl.std
+
+        for mtype in (std.map, std.unordered_map):
+            d = dict((i, i/2.) for i in range(100))
+            m = mtype[int, 'double'].from_dict(d)
+            assert type(m) is mtype[int, 'double']
+            assert len(m) == 100 and m[42] == 21.
+            assert m.to_dict() == d
+
+            d = dict((str(i), i) for i in range(100))
+            d['\u00e9t\u00e9'] = 100
+            d[''] = -1
+            m = mtype[str, int].from_dict(d)
+            assert m['\u00e9t\u00e9'] == 100 and m[''] == -1
+            assert m.to_dict() == d
+            assert sorted(m.keys()) == sorted(d.keys())
+
+            m = mtype['std::string', 'std::string'].from_dict({'a' : 'b', 'cc' : ''})
+            assert m.to_dict() == {'a' : 'b', 'cc' : ''}
+
+            assert mtype[int, int]().to_dict() == {}
+            assert mtype[int, int].from_dict({}).to_dict() == {}
+
+            with raises(TypeError):
+                mtype[int, str].from_dict({'1' : 1, '2' : 2})
+
+            m = mtype({1 : 2.5, 2 : 3.5})           # C++17 deduction, in bulk
+            assert m.to_dict() == {1 : 2.5, 2 : 3.5}
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        m = std.map[int, 'double'].from_dict(dict((i, i/2.) for i in range(10)))
+        assert m.keys().dtype == np.int32
+        assert list(m.keys()) == list(range(10))
+        assert list(m.values()) == [i/2. for i in range(10)]
+        items = m.items()
+        assert list(items['first']) == list(range(10))
+        assert items[3]['second'] == 1.5
+        assert len(std.map[int, int]().keys()) == 0
+
+        m = std.map[str, int].from_dict({'a' : 1})
+        assert m.keys() == ['a']                    # not arithmetic
+        assert m.values().dtype == np.int32
+
 
 class TestSTLITERATOR:
     def setup_class(cls):
@@ -1614,6 +1899,83 @@ class TestSTLSTRING_VIEW:
 
         assert "Lorem ipsum dolor sit amet" in str(text)
 
+    def test03_views_from_buffers(self):
+        """Zero-copy std::string_view and std::span from Python buffers"""
+
+        import cppyy, array, ctypes, gc
+
+        if cppyy.gbl.gInterpreter.ProcessLine("__cplusplus;") <= 201402:
+            # string_view exists as of C++17
+            return
+
+        cppyy.cppdef("""\
+        namespace ViewsFromBuffers {
+            size_t count(std::string_view s) { return s.size(); }
+            char at(std::string_view s, size_t i) { return s[i]; }
+            uintptr_t address(std::string_view s) { return (uintptr_t)s.data(); }
+        }""")
+
+        ns = cppyy.gbl.ViewsFromBuffers
+        std = cppyy.gbl.std
+
+        b = bytearray(b'aap noot')
+        v = std.string_view(b)
+        assert ns.count(v) == 8
+        b[0] = ord('A')                    # no copy
+        assert ns.at(v, 0) == 'A'
+
+        v = std.string_view(b'\x00\x01mies')
+        gc.collect()                       # life line to the bytes object
+        assert ns.count(v) == 6 and ns.at(v, 2) == 'm'
+        assert ns.count(std.string_view(b'')) == 0
+
+      # buffers passed directly where a string_view is expected are not copied
+        b = bytearray(b'aap noot')
+        assert ns.count(b) == 8
+        assert ns.address(b) == ctypes.addressof((ctypes.c_char*len(b)).from_buffer(b))
+        b[0] = ord('B')
+        assert ns.at(b, 0) == 'B'
+
+        if cppyy.gbl.gInterpreter.ProcessLine("__cplusplus;") <= 201703:
+            # span exists as of C++20
+            return
+
+        cppyy.cppdef("""\
+        namespace ViewsFromBuffers {
+            double sum(std::span<const double> s) { double r = 0.; for (auto d : s) r += d; return r; }
+            void twice(std::span<double> s) { for (auto& d : s) d *= 2.; }
+            uintptr_t address(std::span<const double> s) { return (uintptr_t)s.data(); }
+        }""")
+
+        a = array.array('d', [1., 2., 3.])
+        assert ns.sum(std.span['const double'](a)) == 6.
+        ns.twice(std.span['double'](a))
+        assert list(a) == [2., 4., 6.]
+
+      # buffers passed directly where a span is expected are not copied
+        assert ns.sum(a) == 12.
+        assert ns.address(a) == a.buffer_info()[0]
+        ns.twice(a)
+        assert list(a) == [4., 8., 12.]
+        a[0] = 0.
+        assert ns.sum(a) == 20.
+
+        with raises(TypeError):
+            std.span['double'](b'\x00'*8)        # read-only
+
+        try:
+            import numpy as np
+        except ImportError:
+            return
+
+        x = np.arange(10, dtype=np.float64)
+        assert ns.sum(std.span['const double'](x)) == 45.
+
+        assert ns.sum(x) == 45.
+        assert ns.address(x) == x.ctypes.data
+        ns.twice(x)
+        assert x[9] == 18.
+
 
 class TestSTLDEQUE:
     def setup_class(cls):
@@ -1824,6 +2186,29 @@ class TestSTLTUPLE:
         assert s1.fInt == 42
         assert s2.fInt == 42
 
+    def test05_tuple_astuple(self):
+        """Unpacking of all tuple elements at once"""
+
+        import cppyy
+        std = cppyy.gbl.std
+
+        t = std.make_tuple[int, 'long long', 'double'](1, 2**40, 5.)
+        res = t.astuple()
+        assert type(res) is tuple
+        assert res == (1, 2**40, 5.)
+        assert t[-1] == 5.
+        with raises(IndexError):
+            t[3]
+
+        t = std.make_tuple['unsigned int', 'float'](3, 0.5)
+        assert t.astuple() == (3, 0.5)
+
+        t = std.make_tuple(1, '2', 5.)           # not all arithmetic
+        a, b, c = t.astuple()
+        assert a == 1
+        assert b == '2'
+        assert c == 5.
+
 
 class TestSTLPAIR:
     def setup_class(cls):
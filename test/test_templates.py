@@ -1148,6 +1148,76 @@ class TestTEMPLATES:
         assert ns.stringify["const char*"]("Aap")                    == "Aap "
         assert ns.stringify(ctypes.c_char_p(bytes("Noot", "ascii"))) == "Noot "
 
+    def test35_template_cache(self):
+        """Persisted template instantiations, replayed in a new process"""
+
+        import cppyy, json, subprocess, sys, tempfile
+
+        fd, fname = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        os.remove(fname)
+        try:
+            code = "import cppyy; stats = cppyy.set_template_cache(%r);"\
+                   "assert cppyy.gbl.std.vector['long double'];"\
+                   "assert cppyy.gbl.std.map['int', 'long double'];"\
+                   "print(stats['replayed'])" % fname
+
+          # first run records, second run replays
+            out = subprocess.check_output([sys.executable, '-c', code])
+            assert int(out.strip().split()[-1]) == 0
+            out = subprocess.check_output([sys.executable, '-c', code])
+            assert 2 <= int(out.strip().split()[-1])
+
+            with open(fname) as f:
+                recorded = json.load(f)
+            assert 'std::vector<long double>' in recorded
+
+          # names that fail to replay are marked as failed, and neither retried
+          # nor recorded again (even if they are instantiated later)
+            recorded['std::vector<TemplateCacheUndeclared>'] = 0.
+            with open(fname, 'w') as f:
+                json.dump(recorded, f)
+            code = "import cppyy; stats = cppyy.set_template_cache(%r);"\
+                   "cppyy.cppdef('struct TemplateCacheUndeclared {};');"\
+                   "assert cppyy.gbl.std.vector['TemplateCacheUndeclared'];"\
+                   "print(stats['replayed'], stats['failed'])" % fname
+            out = subprocess.check_output([sys.executable, '-c', code])
+            assert [int(x) for x in out.strip().split()[-2:]] == [len(recorded)-1, 1]
+            with open(fname) as f:
+                recorded = json.load(f)
+            assert recorded['std::vector<TemplateCacheUndeclared>'] is None
+            assert 'std::vector<long double>' in recorded
+
+            out = subprocess.check_output([sys.executable, '-c', code])
+            assert [int(x) for x in out.strip().split()[-2:]] == [len(recorded)-1, 0]
+            with open(fname) as f:
+                assert json.load(f)['std::vector<TemplateCacheUndeclared>'] is None
+        finally:
+            if os.path.exists(fname):
+                os.remove(fname)
+
+        assert cppyy.template_cache_stats() is None
+
+    def test36_instantiate_many(self):
+        """Bulk instantiation of templated classes"""
+
+        import cppyy
+
+        cppyy.cppdef("namespace InstantiateMany { struct A {}; struct B {}; }")
+        std, ns = cppyy.gbl.std, cppyy.gbl.InstantiateMany
+
+        types = [int, 'double', ns.A, ns.B, 'std::string', 'unsigned long']
+        classes = std.vector.instantiate_many(types)
+        assert len(classes) == len(types)
+        for t, cls in zip(types, classes):
+            assert cls is std.vector[t]
+
+        pairs = std.pair.instantiate_many([(int, 'double'), ('std::string', ns.A)])
+        assert pairs[0] is std.pair[int, 'double']
+        assert pairs[1] is std.pair['std::string', ns.A]
+
+        assert std.vector.instantiate_many([]) == []
+
 
 class TestTEMPLATED_TYPEDEFS:
     def setup_class(cls):